@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Asyncio event loop for NeoPixelEmulator.
+#
+# Input handling, effect stepping, rendering and presentation run as
+# separate tasks with their own cadence in one thread:
+# - input: waits for SDL events (SDL_WaitEventTimeout in an executor
+#   thread, so the loop is not woken up by polling) and posts them to an
+#   event queue
+# - dispatch: applies events from the queue to the strips
+# - step: advances the effect of a strip every delay seconds
+# - render: renders a strip as soon as its position changed
+# - present: shows the rendered pixels at a fixed frame rate
+# Other input sources (e.g., stdin_source) post to the same queue, so a
+# key press takes effect on the next frame instead of after the delay.
+# The keys are the same as for NeoPixelEmulator.run(): left/right step,
+# up/down change the brightness, l prints the latency, p the profile and
+# escape quits.
+#
+# Note: SDL pumps events in the waiting thread; this works with X11 and
+# Wayland but not on macOS, where events must be pumped by the main
+# thread.
+#
+# Usage: ./emulator.py --async ls_bar
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - wait for SDL events in an executor thread instead of polling
+# - support the up/down, l and p keys of NeoPixelEmulator.run()
+
+import sys
+import ctypes
+import asyncio
+
+
+class Strip():
+    """An emulated strip together with its effect and position."""
+
+    def __init__(self, npe, func, getcolor, delay=0.05, step=False):
+        self.npe = npe
+        self.func = func
+        self.getcolor = getcolor
+        self.delay = delay          # seconds per automatic step
+        self.step = step            # no automatic stepping
+        self.position = 0
+        self.changed = asyncio.Event()
+        self.changed.set()          # render the first frame
+
+    def move(self, delta):
+        self.position += delta
+        self.changed.set()
+
+
+class Runner():
+
+    def __init__(self, strips, fps=60, timeout=100):
+        self.strips = strips
+        self.fps = fps              # frame rate of presentation
+        self.timeout = timeout      # ms to wait for an SDL event at once
+        self.events = asyncio.Queue()
+        self.stopped = asyncio.Event()
+
+    def post(self, action, strip=None):
+        """Posts an action ("left", "right", "up", "down", "latency",
+        "profile" or "quit") for one strip (or all strips if strip is
+        None)."""
+        self.events.put_nowait((action, strip))
+
+    async def _input(self):
+        import sdl2
+        loop = asyncio.get_running_loop()
+        windows = {sdl2.SDL_GetWindowID(s.npe.window.window): s for s in self.strips if s.npe.window}
+        keys = {sdl2.SDLK_LEFT: "left", sdl2.SDLK_RIGHT: "right",
+                sdl2.SDLK_UP: "up", sdl2.SDLK_DOWN: "down",
+                sdl2.SDLK_l: "latency", sdl2.SDLK_p: "profile",
+                sdl2.SDLK_ESCAPE: "quit"}
+        stamped = ("left", "right", "up", "down")
+        event = sdl2.SDL_Event()
+        while True:
+            # the timeout bounds the time the thread outlives a cancellation
+            if not await loop.run_in_executor(None, sdl2.SDL_WaitEventTimeout, ctypes.byref(event), self.timeout):
+                continue
+            if event.type == sdl2.SDL_QUIT:
+                self.post("quit")
+            elif event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym in keys:
+                action = keys[event.key.keysym.sym]
+                strip = windows.get(event.key.windowID)
+                if action in stamped:
+                    for s in ([strip] if strip else self.strips):
+                        s.npe.stamp(event)
+                self.post(action, strip)
+
+    async def _dispatch(self):
+        while True:
+            action, strip = await self.events.get()
+            if action == "quit":
+                self.stopped.set()
+                return
+            for s in ([strip] if strip else self.strips):
+                npe = s.npe
+                if action in ("left", "right"):
+                    s.move(-1 if action == "left" else 1)
+                elif action in ("up", "down"):
+                    delta = 0.05 if action == "up" else -0.05
+                    npe.set_brightness((npe.lut.brightness if npe.lut else 1.0) + delta)
+                    npe.latency.rendered()
+                    npe.show()
+                elif action == "latency":
+                    print(npe.latency)
+                elif action == "profile" and npe.profiler:
+                    print(npe.profiler.report())
+
+    async def _step(self, strip):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += strip.delay
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            if not strip.step:
+                strip.move(1)
+
+    async def _render(self, strip):
+        while True:
+            await strip.changed.wait()
+            strip.changed.clear()
+            strip.npe.render(strip.position, strip.func, strip.getcolor)
+
+    async def _present(self, strip):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            deadline += 1 / self.fps
+            await asyncio.sleep(max(0, deadline - loop.time()))
+            strip.npe.show()
+
+    async def run(self):
+        tasks = [asyncio.create_task(self._dispatch())]
+        if any(s.npe.window for s in self.strips):
+            tasks.append(asyncio.create_task(self._input()))
+        for strip in self.strips:
+            tasks.append(asyncio.create_task(self._step(strip)))
+            tasks.append(asyncio.create_task(self._render(strip)))
+            tasks.append(asyncio.create_task(self._present(strip)))
+        await self.stopped.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return 0
+
+
+def stdin_source(runner):
+    """Reads actions from stdin ("+" = right, "-" = left, "q" = quit)
+    without a thread (POSIX only)."""
+    actions = {"+": "right", "-": "left", "q": "quit"}
+
+    def read():
+        line = sys.stdin.readline()
+        if not line:
+            asyncio.get_running_loop().remove_reader(sys.stdin)
+        for c in line:
+            if c in actions:
+                runner.post(actions[c])
+
+    asyncio.get_running_loop().add_reader(sys.stdin, read)
@@ -0,0 +1,196 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Vectorized batch rendering of the effects from demos.py.
+#
+# Renders a whole range of k values for a strip of n pixels into one
+# (frames, n, 3) uint8 array using NumPy. The per-pixel functions in
+# demos.py remain the reference implementation; every kernel here must
+# produce exactly the same pixels.
+#
+# Usage: import as a module (host only, requires NumPy)
+#
+#   frames = batch.render(demos.ls_bar, range(256), 1024, demos.col_const)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - kernels by effect name, used for effects registered with batch=True
+
+from math import sin
+from random import getrandbits
+
+import numpy as np
+
+import demos
+import palette
+import registry
+
+
+def _color(getcolor):
+    """The effects call getcolor() once per lit pixel, but the color
+    functions return the same color within a frame, so one call is
+    enough for the whole batch."""
+    return np.array(getcolor(), dtype=np.uint8)
+
+
+def _paint(mask, color):
+    """Turns a (frames, n) boolean mask into (frames, n, 3) pixels."""
+    frames = np.zeros(mask.shape + (3,), dtype=np.uint8)
+    frames[mask] = color
+    return frames
+
+
+def _bits(ks, n):
+    """Bits 0..n of k % 2**n in two's complement, shape (frames, n+1).
+
+    Bit n is always 0 (k % 2**n has only n bits). Shifts are clamped
+    to 63 so that the sign bit fills the high bits of negative k, just
+    as Python's k % 2**n does.
+    """
+    shifts = np.minimum(np.arange(n + 1), 63)
+    bits = (ks[:, None] >> shifts) & 1
+    bits[:, n] = 0
+    return bits.astype(bool)
+
+
+def _position(ks, n, idx):
+    return idx == ((ks - 1) % n)[:, None]
+
+
+def _unary(ks, n, idx):
+    return idx < (ks % (n + 1))[:, None]
+
+
+def _strip(ks, n, idx):
+    on = (ks % n)[:, None]
+    return np.where((ks % (2 * n) < n)[:, None], idx < on, idx >= on)
+
+
+def _bar(ks, n, idx):
+    phase = (ks % (4 * n))[:, None]
+    on = (ks % n)[:, None]
+    return np.select(
+        [phase < n, phase < 2 * n, phase < 3 * n],
+        [idx < on, idx >= on, idx >= n - on],
+        idx < n - on)
+
+
+def _binary(ks, n, idx):
+    return _bits(ks, n)[:, :n]
+
+
+def _gray(ks, n, idx):
+    bits = _bits(ks, n)
+    return bits[:, :n] ^ bits[:, 1:]
+
+
+def _pulse(ks, n, idx):
+    off = np.abs(n // 2 - ((ks - 1) % n))[:, None]
+    return (idx >= off) & (idx < n - off)
+
+
+def _band(ks, n, idx):
+    off = np.abs(n // 2 - ((ks - 1) % (n - 1)))[:, None]
+    return (idx == off) | (idx == n - off)
+
+
+def _sine(ks, n, idx):
+    # computed per frame with math.sin to match the reference bit by bit
+    on = [int((1 + sin(((2*3.1415926)/40) * (k % 40)))/2 * n) for k in ks.tolist()]
+    return idx == np.array(on, dtype=np.int64)[:, None]
+
+
+def _random(ks, n, idx):
+    # one getrandbits(n) per frame like the reference; the most
+    # significant bit goes to pixel 0
+    size = (n + 7) // 8
+    data = b"".join(getrandbits(n).to_bytes(size, "big") for _ in range(len(ks)))
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8).reshape(len(ks), size), axis=1)
+    return bits[:, 8 * size - n:].astype(bool)
+
+
+def table(colors):
+    """Turns a palette (list of 256 (r, g, b) tuples) into a (256, 3)
+    array."""
+    return np.array(colors, dtype=np.uint8)
+
+
+def hue(h, colors=palette.WHEEL):
+    """Looks up an array of hues (any shape, wrapped to 0..255) in a
+    palette; returns an array with an additional axis for RGB."""
+    return table(colors)[np.asarray(h) & 255]
+
+
+def hsv(h, s=255, v=255):
+    """Vectorized palette.hsv() for arrays of hue, saturation and value
+    (0..255 each, broadcast against each other)."""
+    h, s, v = np.broadcast_arrays(np.asarray(h, dtype=np.int64) & 255,
+                                  np.asarray(s, dtype=np.int64),
+                                  np.asarray(v, dtype=np.int64))
+    sector = h * 6 // 256
+    frac = h * 6 - sector * 256
+    p = v * (255 - s) // 255
+    q = v * (255 - s * frac // 255) // 255
+    t = v * (255 - s * (255 - frac) // 255) // 255
+    r = np.choose(sector, (v, q, p, p, t, v))
+    g = np.choose(sector, (t, v, v, q, p, p))
+    b = np.choose(sector, (p, p, t, v, v, q))
+    return np.stack((r, g, b), axis=-1).astype(np.uint8)
+
+
+def _cycle(colors):
+    """Kernel for rainbow._cycle with the given palette."""
+    def kernel(ks, n, getcolor):
+        pos = (np.arange(n) * 256 // n)[None, :] + ks[:, None]
+        return hue(pos, colors)
+    return kernel
+
+
+# effects that are a lit/unlit mask in a single color
+masks = {
+    "ls_position": _position,
+    "ls_unary": _unary,
+    "ls_strip": _strip,
+    "ls_bar": _bar,
+    "ls_binary": _binary,
+    "ls_gray": _gray,
+    "ls_pulse": _pulse,
+    "ls_band": _band,
+    "ls_sine": _sine,
+    "ls_random": _random,
+}
+
+# effects that compute their own colors
+kernels = {
+    "ls_rainbow": _cycle(palette.WHEEL),
+}
+
+
+def reference(func, ks, n, getcolor):
+    """Renders frames by calling func once per k (slow path)."""
+    ks = list(ks)
+    frames = np.zeros((len(ks), n, 3), dtype=np.uint8)
+    pixels = [demos.OFF] * n
+    for f, k in enumerate(ks):
+        func(k, n, pixels, getcolor)
+        frames[f] = pixels
+    return frames
+
+
+def render(func, ks, n, getcolor):
+    """Renders func for all k in ks into a (frames, n, 3) uint8 array.
+
+    Effects without a vectorized kernel fall back to reference().
+    """
+    ks = np.asarray(ks, dtype=np.int64).reshape(-1)
+    effect = registry.lookup(func)
+    if effect is not None and effect.batch:
+        if effect.name in masks:
+            return _paint(masks[effect.name](ks, n, np.arange(n)[None, :]), _color(getcolor))
+        if effect.name in kernels:
+            return kernels[effect.name](ks, n, getcolor)
+    return reference(func, ks.tolist(), n, getcolor)
@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Benchmark of the effects from demos.py.
+#
+# Times every ls_* effect for several strip sizes and color functions
+# and reports frames per second, time per frame and allocated bytes per
+# frame. Results can be saved as JSON and compared against a saved
+# baseline to find regressions.
+#
+# Usage: ./benchmark.py -o baseline.json
+#        ./benchmark.py --compare baseline.json
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+import demos
+import registry
+import pixelbuffer
+
+version = "0.0.1"
+
+sizes = [8, 64, 512, 4096, 16384]
+colors = ["col_const", "col_rand"]
+
+
+def effects():
+    return sorted(registry.names())
+
+
+def measure(func, n, getcolor, pixels, min_time=0.1, min_frames=3):
+    """Returns (frames, seconds, allocated bytes per frame) for func."""
+    # allocations: peak of one frame while tracing
+    tracemalloc.start()
+    func(1, n, pixels, getcolor)
+    alloc = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    frames = 0
+    start = time.perf_counter()
+    elapsed = 0
+    while elapsed < min_time or frames < min_frames:
+        func(frames, n, pixels, getcolor)
+        frames += 1
+        elapsed = time.perf_counter() - start
+    return frames, elapsed, alloc
+
+
+def run(names, sizes, colors, min_time, buffer=False):
+    results = []
+    for name in names:
+        for n in sizes:
+            for color in colors:
+                if buffer:
+                    pixels = pixelbuffer.PixelBuffer(n)
+                else:
+                    pixels = [demos.OFF] * n
+                frames, elapsed, alloc = measure(registry.get(name), n, getattr(demos, color), pixels, min_time)
+                result = {
+                    "effect": name,
+                    "n": n,
+                    "color": color,
+                    "frames": frames,
+                    "fps": frames / elapsed,
+                    "frame_ms": 1000 * elapsed / frames,
+                    "alloc_bytes": alloc
+                }
+                print("{effect:12} {n:6} {color:9} {fps:10.1f} fps {frame_ms:10.4f} ms {alloc_bytes:9} B".format(**result))
+                results.append(result)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Prints the change of the frame time against baseline and returns
+    the number of regressions (slower by more than threshold)."""
+    base = {(r["effect"], r["n"], r["color"]): r for r in baseline["results"]}
+    regressions = 0
+    for r in results:
+        b = base.get((r["effect"], r["n"], r["color"]))
+        if b is None:
+            continue
+        change = r["frame_ms"] / b["frame_ms"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        print("{:12} {:6} {:9} {:10.4f} ms → {:10.4f} ms {:+7.1%} {}".format(
+            r["effect"], r["n"], r["color"], b["frame_ms"], r["frame_ms"], change, flag))
+    return regressions
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Benchmark the effects from demos.py.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('effect', type=str, help='effects to benchmark (default: all)', nargs='*')
+    parser.add_argument('-s', '--sizes', type=int, metavar="NUM", help='numbers of LEDs', nargs='+', default=sizes)
+    parser.add_argument('-c', '--colors', choices=colors, help='functions for color', nargs='+', default=colors)
+    parser.add_argument('-t', '--time', type=float, metavar="S", help='minimal time per measurement', default=0.1)
+    parser.add_argument('-b', '--buffer', action="store_true", help='render into a PixelBuffer instead of a list')
+    parser.add_argument('-o', '--output', type=str, metavar="FILE", help='save results as JSON')
+    parser.add_argument('--compare', type=str, metavar="FILE", help='compare with baseline JSON file')
+    parser.add_argument('--threshold', type=float, metavar="F", help='relative slowdown reported as regression', default=0.1)
+    parser.add_argument('-v', '--version', action="version", version="%(prog)s " + version)
+
+    args = parser.parse_args()
+
+    results = run(args.effect or effects(), args.sizes, args.colors, args.time, args.buffer)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "results": results
+            }, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        sys.exit(1 if compare(results, baseline, args.threshold) > 0 else 0)
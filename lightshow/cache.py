@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Frame cache for the periodic effects from demos.py.
+#
+# Most effects are pure functions of k modulo some period. The cache
+# renders the full cycle of such an effect once per (effect, n, color)
+# and then plays the frames back by index. Tables are evicted least
+# recently used first once the memory limit is reached. Effects that
+# are not pure or have no period in the registry (e.g., ls_random)
+# bypass the cache; so do effects whose cycle would not fit into the
+# memory limit (e.g., the 2**n frames of binary counters), which is
+# decided once per (effect, n).
+#
+# Usage: import as a module
+#
+#   frames = cache.FrameCache(64 * 1024)
+#   frames.set(k, demos.ls_bar, num_pixels, pixels, demos.col_rand)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - periods from the effect registry (registry.py)
+# - decide once per (effect, n) whether the table fits, count oversized
+#   tables separately from bypassed effects
+
+from collections import OrderedDict
+import demos
+import registry
+
+# approximate bytes per cached pixel (one reference to a shared color)
+PIXEL_SIZE = 8
+
+
+class FrameCache():
+
+    def __init__(self, maxsize=256 * 1024):
+        self.maxsize = maxsize      # memory limit in bytes
+        self.size = 0               # bytes currently used
+        self.tables = OrderedDict() # (effect, n, color) -> frames
+        self.periods = {}           # (effect, n) -> frames of a table (None if too big)
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0           # not pure or no period
+        self.oversized = 0          # table larger than maxsize
+
+    def set(self, k, func, n, pixels, getcolor):
+        """Like func(k, n, pixels, getcolor) but plays the frame from the
+        cache if possible."""
+        table = self.get(func, n, getcolor)
+        if table is None:
+            func(k, n, pixels, getcolor)
+        else:
+            pixels[0:n] = table[k % len(table)]
+
+    def get(self, func, n, getcolor):
+        """Returns the table of frames for func or None if func can not
+        (or should not) be cached."""
+        effect = registry.lookup(func)
+        if effect is None or not effect.pure or effect.period is None:
+            self.bypassed += 1
+            return None
+        period = self._period(func, n, effect.period)
+        if period is None:
+            self.oversized += 1
+            return None
+        key = (func, n, getcolor())
+        table = self.tables.pop(key, None)
+        if table is not None:
+            self.hits += 1
+        else:
+            size = period * n * PIXEL_SIZE
+            self.misses += 1
+            while self.size + size > self.maxsize:
+                self._evict()
+            table = self._compile(func, n, getcolor, period)
+            self.size += size
+        self.tables[key] = table    # (re-)insert as most recently used
+        return table
+
+    def _period(self, func, n, period):
+        """Returns the number of frames of the table of func for n pixels
+        or None if the table would not fit into the memory limit."""
+        key = (func, n)
+        if key not in self.periods:
+            frames = period(n)
+            self.periods[key] = frames if frames * n * PIXEL_SIZE <= self.maxsize else None
+        return self.periods[key]
+
+    def _compile(self, func, n, getcolor, period):
+        table = []
+        for k in range(period):
+            frame = [demos.OFF] * n
+            func(k, n, frame, getcolor)
+            table.append(tuple(frame))
+        return table
+
+    def _evict(self):
+        key = next(iter(self.tables))
+        table = self.tables.pop(key)
+        self.size -= len(table) * key[1] * PIXEL_SIZE
+
+    def clear(self):
+        self.tables.clear()
+        self.size = 0
+
+    def __repr__(self):
+        return "FrameCache(hits={}, misses={}, bypassed={}, oversized={}, tables={}, size={}/{})".format(
+            self.hits, self.misses, self.bypassed, self.oversized, len(self.tables), self.size, self.maxsize)
@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Segment compositor: several effects on one strip.
+#
+# Each segment runs its own effect with its own k and speed on a range
+# of the strip. Segments are layers: they are rendered in order and
+# blended into the shared pixel buffer while the effect writes them
+# (overwrite, add, max or alpha), so there are no intermediate buffers.
+# A Compositor is itself an effect with the classic arguments
+# (k, n, pixels, getcolor) and can be used wherever an ls_* function
+# can.
+#
+# Usage: import as a module
+#
+#   comp = compositor.Compositor()
+#   comp.add(0, 30, demos.ls_bar, demos.col_rand)
+#   comp.add(30, 60, rainbow.ls_rainbow, demos.col_rand, speed=2)
+#   comp.add(0, 60, demos.ls_position, demos.col_const, blend="add")
+#   comp(k, 60, pixels, demos.col_rand)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - clear the strip only if necessary (segments with effects that are
+#   not in place or do not cover all pixels)
+# - segments check indices (negative indices count from the end of the
+#   segment), so effects cannot write into neighbouring segments
+
+from demos import OFF
+import registry
+
+
+def _add(old, new, alpha):
+    return (min(old[0] + new[0], 255), min(old[1] + new[1], 255), min(old[2] + new[2], 255))
+
+
+def _max(old, new, alpha):
+    return (max(old[0], new[0]), max(old[1], new[1]), max(old[2], new[2]))
+
+
+def _alpha(old, new, alpha):
+    if new == OFF:                  # off pixels are transparent
+        return old
+    return ((new[0] * alpha + old[0] * (255 - alpha)) // 255,
+            (new[1] * alpha + old[1] * (255 - alpha)) // 255,
+            (new[2] * alpha + old[2] * (255 - alpha)) // 255)
+
+
+blends = {
+    "overwrite": None,
+    "add": _add,
+    "max": _max,
+    "alpha": _alpha
+}
+
+
+class Segment():
+    """A range of the strip that looks like a strip of its own to an
+    effect. Writes go straight to the underlying pixels."""
+
+    def __init__(self, start, stop, effect, getcolor=None, speed=1, offset=0, alpha=255):
+        self.start = start
+        self.n = stop - start
+        self.effect = effect
+        self.getcolor = getcolor
+        self.speed = speed          # steps of k per compositor step
+        self.offset = offset        # k at compositor step 0
+        self.alpha = alpha          # weight for "alpha" (off is transparent)
+        self.pixels = None          # set by Compositor for each frame
+
+    def __len__(self):
+        return self.n
+
+    def _index(self, index):
+        if index < 0:
+            index += self.n
+        if index < 0 or index >= self.n:
+            raise IndexError("segment index out of range")
+        return index
+
+    def __setitem__(self, index, value):
+        # effects write single pixels: keep this path as short as possible
+        try:
+            if not 0 <= index < self.n:
+                index = self._index(index)
+        except TypeError:
+            self._setslice(index, value)
+            return
+        self.pixels[self.start + index] = value
+
+    def _setslice(self, index, value):
+        for i, v in zip(range(*index.indices(self.n)), value):
+            self[i] = v
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.n:
+            index = self._index(index)
+        return self.pixels[self.start + index]
+
+    def render(self, k, pixels, getcolor):
+        self.pixels = pixels
+        self.effect(int(k * self.speed) + self.offset, self.n, self, self.getcolor or getcolor)
+
+
+class BlendSegment(Segment):
+    """A segment that blends what the effect writes with the pixels of
+    the layers below."""
+
+    def __init__(self, start, stop, effect, getcolor=None, blend="add", **kwargs):
+        Segment.__init__(self, start, stop, effect, getcolor, **kwargs)
+        self.blend = blends[blend]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._setslice(index, value)
+            return
+        if isinstance(value, int):
+            value = ((value >> 16) & 255, (value >> 8) & 255, value & 255)
+        if not 0 <= index < self.n:
+            index = self._index(index)
+        j = self.start + index
+        self.pixels[j] = self.blend(self.pixels[j], value, self.alpha)
+
+
+class Compositor():
+
+    def __init__(self, clear=None):
+        self.__name__ = "compositor"
+        self.segments = []
+        self.clear = clear          # start each frame with all pixels off
+        self.auto = None            # (n, segments) → clear (for clear=None)
+
+    def add(self, start, stop, effect, getcolor=None, blend="overwrite", **kwargs):
+        """Adds a segment as top layer; see Segment for the arguments."""
+        if blend not in blends:
+            raise ValueError("unknown blend mode: " + blend)
+        if blends[blend] is None:
+            segment = Segment(start, stop, effect, getcolor, **kwargs)
+        else:
+            segment = BlendSegment(start, stop, effect, getcolor, blend, **kwargs)
+        self.segments.append(segment)
+        return segment
+
+    def _covered(self, n):
+        """True if overwriting segments with in-place effects (see
+        registry.py) cover all n pixels."""
+        spans = []
+        for s in self.segments:
+            effect = registry.lookup(s.effect)
+            if type(s) is Segment and effect is not None and effect.inplace:
+                spans.append((s.start, s.start + s.n))
+        end = 0
+        for start, stop in sorted(spans):
+            if start > end:
+                return False
+            end = max(end, stop)
+        return end >= n
+
+    def __call__(self, k, n, pixels, getcolor):
+        clear = self.clear
+        if clear is None:
+            if self.auto is None or self.auto[:2] != (n, len(self.segments)):
+                self.auto = (n, len(self.segments), not self._covered(n))
+            clear = self.auto[2]
+        if clear:
+            if hasattr(pixels, "fill"):
+                pixels.fill(OFF)
+            else:
+                for i in range(n):
+                    pixels[i] = OFF
+        for segment in self.segments:
+            segment.render(k, pixels, getcolor)
+
+
+def split(n, effects, getcolor=None, **kwargs):
+    """Returns a Compositor that splits n pixels evenly among effects."""
+    comp = Compositor()
+    for i, effect in enumerate(effects):
+        comp.add(i * n // len(effects), (i + 1) * n // len(effects), effect, getcolor, **kwargs)
+    return comp
@@ -0,0 +1,199 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Network pixel sink using DDP (Distributed Display Protocol) over UDP.
+#
+# The receiver decodes DDP packets straight into a PixelBuffer (slice
+# assignments on its bytearray, no per-pixel objects). Large frames
+# are split into several packets with byte offsets; the last packet of a
+# frame has the push flag set. The sender (used as load generator)
+# gives all packets of a frame the same sequence number (1..15), so the
+# receiver can count
+# - dropped: frames that never arrived (gaps in the sequence numbers)
+# - late: packets of a frame older than the current one, including
+#   packets of a frame that arrive after its push (discarded)
+# - out of order: packets of the current frame with a smaller offset
+#   than their predecessor
+# Packets may have any length: the bytes are reordered by their channel
+# (offset % 3), so pixels split across packets keep their colors.
+#
+# Usage: ./emulator.py --listen 4048 -s 10000
+#        ./ddp.py -s 10000 --fps 60 ls_rainbow  (send to localhost)
+#
+# Header (10 bytes, big endian):
+# | bytes | content                                               |
+# |-------+-------------------------------------------------------|
+# |     1 | flags: version 1 (0x40), timecode (0x10), push (0x01) |
+# |     1 | sequence number (lower 4 bits, 0 = not used)          |
+# |     1 | data type (0x0B = RGB, 8 bit per channel)             |
+# |     1 | destination id (1 = display)                          |
+# |     4 | data offset in bytes                                  |
+# |     2 | data length in bytes                                  |
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - stragglers after the push count as late, pixels split across
+#   packets are reordered correctly
+
+import socket
+import struct
+
+PORT = 4048
+HEADER = struct.Struct(">BBBBIH")
+VERSION1 = 0x40
+TIMECODE = 0x10
+PUSH = 0x01
+RGB24 = 0x0B
+DISPLAY = 1
+MAX_DATA = 1440     # bytes per packet (480 pixels)
+
+
+class Receiver():
+
+    def __init__(self, pixels, host="127.0.0.1", port=PORT):
+        self.pixels = pixels        # PixelBuffer
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 2**21)
+        self.sock.bind((host, port))
+        self.sock.setblocking(False)
+        self.packet = bytearray(HEADER.size + 4 + MAX_DATA * 2)
+        self.view = memoryview(self.packet)
+        self.seq = 0                # sequence number of the current frame
+        self.expect = 0             # sequence number of the next frame
+        self.pushed = 0             # sequence number of the last pushed frame
+        self.last_offset = -1       # offset of the previous packet
+        self.packets = 0
+        self.frames = 0             # completed (pushed) frames
+        self.dropped = 0
+        self.late = 0
+        self.out_of_order = 0
+        self.invalid = 0
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def poll(self):
+        """Decodes all pending packets and returns the number of frames
+        that were completed."""
+        frames = self.frames
+        while True:
+            try:
+                length = self.sock.recv_into(self.packet)
+            except BlockingIOError:
+                break
+            self._decode(length)
+        return self.frames - frames
+
+    def _decode(self, length):
+        if length < HEADER.size:
+            self.invalid += 1
+            return
+        flags, seq, dtype, dest, offset, size = HEADER.unpack_from(self.packet)
+        start = HEADER.size + (4 if flags & TIMECODE else 0)
+        if flags & 0xc0 != VERSION1 or start + size > length:
+            self.invalid += 1
+            return
+        self.packets += 1
+        seq &= 0x0f
+        if seq and seq != self.seq:                 # a new frame
+            if seq == self.pushed:                  # straggler of the shown frame
+                self.late += 1
+                return
+            ahead = (seq - self.expect) % 15 if self.expect else 0
+            if ahead > 7:                           # packet of an older frame
+                self.late += 1
+                return
+            self.dropped += ahead                   # frames never seen (after the current one)
+            if self.seq:                            # current frame without push
+                self.dropped += 1
+            self.seq = seq
+            self.expect = seq % 15 + 1
+        elif offset < self.last_offset:
+            self.out_of_order += 1
+        self.last_offset = offset
+        self._write(offset, self.view[start:start + size])
+        if flags & PUSH:
+            self.frames += 1
+            self.pushed = seq
+            self.seq = 0
+            self.last_offset = -1
+
+    def _write(self, offset, data):
+        buf = self.pixels.buf
+        size = min(len(data), len(buf) - offset)
+        if size <= 0:
+            return
+        if self.pixels.byteorder == "RGB":
+            buf[offset:offset + size] = data[:size]
+            return
+        # byte j of data is channel (offset + j) % 3 of pixel (offset + j) // 3
+        for c, o in zip(range(3), self.pixels.offsets):
+            j = (c - offset) % 3                    # first byte of channel c
+            count = len(range(j, size, 3))
+            if count:
+                dst = offset + j - c + o
+                buf[dst:dst + 3 * count - 2:3] = data[j:size:3]
+
+    def close(self):
+        self.sock.close()
+
+    def __repr__(self):
+        return "packets: {}, frames: {}, dropped: {}, late: {}, out of order: {}, invalid: {}".format(
+            self.packets, self.frames, self.dropped, self.late, self.out_of_order, self.invalid)
+
+
+class Sender():
+
+    def __init__(self, host="127.0.0.1", port=PORT):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addr = (host, port)
+        self.seq = 0
+
+    def send(self, frame):
+        """Sends one frame (RGB bytes) in as many packets as needed."""
+        frame = memoryview(frame).cast("B")
+        self.seq = self.seq % 15 + 1
+        for offset in range(0, len(frame), MAX_DATA):
+            data = frame[offset:offset + MAX_DATA]
+            last = offset + MAX_DATA >= len(frame)
+            header = HEADER.pack(VERSION1 | (PUSH if last else 0), self.seq, RGB24, DISPLAY, offset, len(data))
+            self.sock.sendto(header + data, self.addr)
+
+    def close(self):
+        self.sock.close()
+
+
+if __name__ == '__main__':
+    import time
+    import argparse
+    import demos
+    import registry
+    import pixelbuffer
+
+    parser = argparse.ArgumentParser(description='Send an effect via DDP (load generator for emulator.py --listen).', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('function', type=str, help='effect to send')
+    parser.add_argument('-c', '--color', choices=["col_const", "col_rand"], help='function for color', default="col_const")
+    parser.add_argument('-s', '--size', type=int, metavar="NUM", help='number of LEDs', default=8)
+    parser.add_argument('--host', type=str, help='receiver', default="127.0.0.1")
+    parser.add_argument('-p', '--port', type=int, help='UDP port', default=PORT)
+    parser.add_argument('--fps', type=float, metavar="FPS", help='frame rate', default=60)
+    parser.add_argument('-n', '--frames', type=int, metavar="NUM", help='number of frames', default=600)
+
+    args = parser.parse_args()
+
+    func = registry.get(args.function)
+    getcolor = getattr(demos, args.color)
+    pixels = pixelbuffer.PixelBuffer(args.size, "RGB")
+    sender = Sender(args.host, args.port)
+    start = deadline = time.monotonic()
+    for k in range(args.frames):
+        func(k, args.size, pixels, getcolor)
+        sender.send(pixels.buf)
+        deadline += 1 / args.fps
+        time.sleep(max(0, deadline - time.monotonic()))
+    elapsed = time.monotonic() - start
+    print("{} frames in {:.3f} s = {:.1f} frames/s".format(args.frames, elapsed, args.frames / elapsed))
@@ -0,0 +1,257 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Delta/RLE-compressed frame streams.
+#
+# Most effects change only a few pixels from one frame to the next, so
+# a stream stores keyframes (every interval frames) and otherwise only
+# the pixels that changed. Changed pixels are grouped into spans that
+# are run-length encoded:
+#
+# header: "LSDL", version (uint16), n (uint32), color order (char[4]),
+#         keyframe interval (uint32)
+# record: type ("K" = keyframe, "D" = delta, uint8), length (uint32),
+#         operations:
+#           start pixel (uint32), count (uint16), followed by
+#           - one color (3 bytes) repeated count times (run), or
+#           - count colors (3*count bytes) if bit 15 of count is set
+#             (literal)
+#
+# A keyframe is applied to a buffer with all pixels off, a delta to the
+# previous frame. Decoding writes straight into an existing buffer
+# (bytearray or PixelBuffer) with slice assignments.
+#
+# Usage: ./delta.py -o bar.delta bar.show       (encode a show file)
+#        ./delta.py --stats -s 512 -n 1000      (statistics for all effects)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import struct
+
+MAGIC = b"LSDL"
+VERSION = 1
+HEADER = struct.Struct("<4sHI4sI")
+RECORD = struct.Struct("<BI")
+OP = struct.Struct("<IH")
+KEYFRAME = ord("K")
+DELTA = ord("D")
+LITERAL = 0x8000
+MAXCOUNT = 0x7fff
+
+chunk_size = 64     # pixels compared at once when looking for changes
+min_run = 4         # shorter runs are cheaper as part of a literal
+max_gap = 2         # unchanged pixels that may join two changed spans
+
+
+def _spans(prev, cur, n):
+    """Yields (start, stop) of the spans of changed pixels."""
+    chunk = 3 * chunk_size
+    start = stop = None
+    for c in range(0, 3 * n, chunk):
+        if prev[c:c + chunk] == cur[c:c + chunk]:
+            continue
+        for o in range(c, min(c + chunk, 3 * n), 3):
+            if prev[o:o + 3] != cur[o:o + 3]:
+                i = o // 3
+                if start is None:
+                    start = i
+                elif i - stop > max_gap:
+                    yield start, stop
+                    start = i
+                stop = i + 1
+    if start is not None:
+        yield start, stop
+
+
+def encode(prev, cur, n):
+    """Returns the operations that turn prev into cur."""
+    out = bytearray()
+    for start, stop in _spans(prev, cur, n):
+        lit = start             # start of the pending literal
+        i = start
+        while i < stop:
+            color = cur[3 * i:3 * i + 3]
+            j = i + 1
+            while j < stop and j - i < MAXCOUNT and cur[3 * j:3 * j + 3] == color:
+                j += 1
+            if j - i >= min_run:
+                _literal(out, cur, lit, i)
+                out += OP.pack(i, j - i)
+                out += color
+                lit = j
+            i = j
+        _literal(out, cur, lit, stop)
+    return out
+
+
+def _literal(out, cur, start, stop):
+    for s in range(start, stop, MAXCOUNT):
+        count = min(stop - s, MAXCOUNT)
+        out += OP.pack(s, count | LITERAL)
+        out += cur[3 * s:3 * (s + count)]
+
+
+def apply(ops, buf):
+    """Applies operations (from encode()) to buf in place."""
+    ops = memoryview(ops)
+    p = 0
+    while p < len(ops):
+        start, count = OP.unpack_from(ops, p)
+        p += OP.size
+        o = 3 * start
+        if count & LITERAL:
+            count &= MAXCOUNT
+            buf[o:o + 3 * count] = ops[p:p + 3 * count]
+            p += 3 * count
+        else:
+            buf[o:o + 3 * count] = bytes(ops[p:p + 3]) * count
+            p += 3
+
+
+class Encoder():
+
+    def __init__(self, f, n, byteorder="RGB", interval=60):
+        self.file = f
+        self.n = n
+        self.interval = interval    # frames between keyframes
+        self.frames = 0
+        self.prev = bytearray(3 * n)
+        self.size = HEADER.size     # bytes written
+        f.write(HEADER.pack(MAGIC, VERSION, n, byteorder.encode(), interval))
+
+    def write(self, frame):
+        """Appends one frame (bytes-like with 3*n bytes)."""
+        frame = memoryview(frame).cast("B")
+        if self.frames % self.interval == 0:
+            kind = KEYFRAME
+            ops = encode(bytes(3 * self.n), frame, self.n)
+        else:
+            kind = DELTA
+            ops = encode(self.prev, frame, self.n)
+        self.file.write(RECORD.pack(kind, len(ops)))
+        self.file.write(ops)
+        self.prev[:] = frame
+        self.frames += 1
+        self.size += RECORD.size + len(ops)
+
+
+class Decoder():
+
+    def __init__(self, f):
+        self.file = f
+        magic, version, n, byteorder, interval = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a delta stream (version {})".format(VERSION))
+        self.n = n
+        self.byteorder = byteorder.rstrip(b"\0").decode()
+        self.interval = interval
+        self.frame = 0              # index of the next frame
+        self.offsets = None         # file offset of every frame (see seek)
+
+    def read_into(self, buf):
+        """Decodes the next frame into buf (3*n bytes, e.g., a bytearray
+        or PixelBuffer.buf); returns False at the end of the stream."""
+        head = self.file.read(RECORD.size)
+        if len(head) < RECORD.size:
+            return False
+        kind, length = RECORD.unpack(head)
+        ops = self.file.read(length)
+        if kind == KEYFRAME:
+            buf[:] = bytes(3 * self.n)
+        apply(ops, buf)
+        self.frame += 1
+        return True
+
+    def _index(self):
+        self.offsets = []
+        pos = self.file.seek(HEADER.size)
+        while True:
+            head = self.file.read(RECORD.size)
+            if len(head) < RECORD.size:
+                break
+            self.offsets.append(pos)
+            pos = self.file.seek(pos + RECORD.size + RECORD.unpack(head)[1])
+
+    def seek(self, i, buf):
+        """Decodes frame i into buf, starting at the preceding keyframe
+        (requires a seekable file)."""
+        if self.offsets is None:
+            self._index()
+        key = i - i % self.interval
+        self.file.seek(self.offsets[key])
+        self.frame = key
+        while self.frame <= i:
+            self.read_into(buf)
+
+    def __len__(self):
+        if self.offsets is None:
+            pos = self.file.tell()
+            self._index()
+            self.file.seek(pos)
+        return len(self.offsets)
+
+
+def stats(n, frames, interval, getcolor):
+    """Prints compression ratio and decode throughput for all effects."""
+    import io
+    import time
+    import random
+    import registry
+    import pixelbuffer
+    print("{:12} {:>10} {:>10} {:>8} {:>12} {:>10}".format(
+        "effect", "raw", "encoded", "ratio", "decode/s", "MB/s"))
+    for name in sorted(registry.names()):
+        random.seed(0)
+        func = registry.get(name)
+        pixels = pixelbuffer.PixelBuffer(n, "RGB")
+        f = io.BytesIO()
+        enc = Encoder(f, n, "RGB", interval)
+        for k in range(frames):
+            func(k, n, pixels, getcolor)
+            enc.write(pixels.buf)
+        raw = HEADER.size + 3 * n * frames
+        f.seek(0)
+        dec = Decoder(f)
+        buf = bytearray(3 * n)
+        start = time.perf_counter()
+        while dec.read_into(buf):
+            pass
+        elapsed = time.perf_counter() - start
+        print("{:12} {:10} {:10} {:7.1f}x {:12.1f} {:10.1f}".format(
+            name, raw, enc.size, raw / enc.size, frames / elapsed, 3 * n * frames / elapsed / 2**20))
+
+
+if __name__ == '__main__':
+    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Encode show files as delta/RLE-compressed streams.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('input', type=str, help='show file to encode', nargs='?')
+    parser.add_argument('-o', '--output', type=str, metavar="FILE", help='output file')
+    parser.add_argument('-k', '--keyframes', type=int, metavar="NUM", help='frames between keyframes', default=60)
+    parser.add_argument('--stats', action="store_true", help='print compression and decode statistics for all effects')
+    parser.add_argument('-s', '--size', type=int, metavar="NUM", help='number of LEDs (--stats)', default=512)
+    parser.add_argument('-n', '--frames', type=int, metavar="NUM", help='number of frames (--stats)', default=1000)
+    parser.add_argument('-c', '--color', choices=["col_const", "col_rand"], help='function for color (--stats)', default="col_const")
+
+    args = parser.parse_args()
+
+    if args.stats:
+        import demos
+        stats(args.size, args.frames, args.keyframes, getattr(demos, args.color))
+    elif args.input and args.output:
+        import showfile
+        show = showfile.Show(args.input)
+        with open(args.output, "wb") as f:
+            enc = Encoder(f, show.n, show.byteorder, args.keyframes)
+            for i in range(len(show)):
+                enc.write(show.frame(i))
+        print("{} frames: {} → {} bytes".format(len(show), show.offset + 3 * show.n * len(show), enc.size))
+    else:
+        parser.print_usage()
+        sys.exit(1)
@@ -6,15 +6,29 @@
 #
 # Usage: import as a module
 #
-# Arguments:
+# Effects are implemented as fx_* functions with the arguments
+# - f: Frame (colors resolved once per frame and k)
+# - n: number of pixels (LEDs)
+# - pixels: NeoPixel
+#
+# The ls_* functions adapt them to the classic arguments
 # - k: arbitrary integer (= rotary encoder position)
 # - n: number of pixels (LEDs)
 # - pixels: NeoPixel
 # - getcolor: color function
+# and join the registry with their metadata (see registry.py).
 #
 # Author: rja
 #
 # Changes:
+# 2026-10-18 (rja)
+# - table-driven ls_rainbow (palette.py, no rainbowio needed) and
+#   added ls_fire
+# - effects join the registry with metadata (registry.py); ls_rainbow
+#   and ls_fire moved to rainbow.py (imported on first use)
+# - resolve colors once per frame (Frame and fx_* functions)
+# - ls_binary, ls_gray and ls_random work for any n (bit operations
+#   instead of formatted strings)
 # 2024-01-13 (rja)
 # - added col_next and changed col_rand
 # 2024-01-05 (rja)
@@ -32,14 +46,7 @@
 
 from random import randint, getrandbits
 from math import sin
-
-try:
-    from rainbowio import colorwheel
-except ImportError:
-    print("WARNING: rainbowio not found, using constant color")
-
-    def colorwheel(c):
-        return (128, 0, 0)
+from registry import effect
 
 
 # color configuration
@@ -72,7 +79,29 @@ def col_const():
     return colors[0] # red
 
 
-def ls_position(k, n, pixels, getcolor):
+class Frame():
+    """Color context of one frame: the color function is called once
+    per frame instead of once per lit pixel."""
+
+    def __init__(self, k, getcolor, palette=colors):
+        self.k = k                  # frame index (= rotary encoder position)
+        self.color = getcolor()     # primary color
+        self.palette = palette      # available colors
+
+
+def _pattern(word, n, pixels, col, reverse=False):
+    """Lights pixel i if bit i of word is set (bit n-1-i if reverse)."""
+    # walk the word in chunks that fit into a small int (30 bits on
+    # CircuitPython) to avoid shifting a long int once per pixel
+    for base in range(0, n, 30):
+        chunk = word & 0x3fffffff
+        word >>= 30
+        for i in range(base, min(base + 30, n)):
+            pixels[n - 1 - i if reverse else i] = col if chunk & 1 else OFF
+            chunk >>= 1
+
+
+def fx_position(f, n, pixels):
     """0: [        ]
        1: [O       ]
        2: [ O      ]
@@ -81,11 +110,12 @@ def ls_position(k, n, pixels, getcolor):
        ...
        n: [       O]
     """
+    col, on = f.color, (f.k - 1) % n
     for i in range(n):
-        pixels[i] = getcolor() if i == (k - 1) % n else OFF
+        pixels[i] = col if i == on else OFF
 
 
-def ls_unary(k, n, pixels, getcolor):
+def fx_unary(f, n, pixels):
     """0: [        ]
        1: [O       ]
        2: [OO      ]
@@ -94,11 +124,12 @@ def ls_unary(k, n, pixels, getcolor):
        ...
        n: [OOOOOOOO]
     """
+    col, on = f.color, f.k % (n + 1)
     for i in range(n):
-        pixels[i] = getcolor() if i < k % (n + 1) else OFF
+        pixels[i] = col if i < on else OFF
 
 
-def ls_strip(k, n, pixels, getcolor):
+def fx_strip(f, n, pixels):
     """
         | pixels     |  k | k%2*n | on   | test on | if           |
         |------------+----+-------+------+---------+--------------|
@@ -128,14 +159,17 @@ def ls_strip(k, n, pixels, getcolor):
         | [ooo     ] | 19 |     3 | i<3  |         |              |
         | [oooo    ] | 20 |     4 | i<4  |         |              |
     """
-    for i in range(n):
-        if k % (2 * n) < n:
-            pixels[i] = getcolor() if i < k % n else OFF
-        else:
-            pixels[i] = getcolor() if i >= k % n else OFF
+    k, col = f.k, f.color
+    on = k % n
+    if k % (2 * n) < n:
+        for i in range(n):
+            pixels[i] = col if i < on else OFF
+    else:
+        for i in range(n):
+            pixels[i] = col if i >= on else OFF
 
 
-def ls_bar(k, n, pixels, getcolor):
+def fx_bar(f, n, pixels):
     """
         | pixels     |  k | k%4*n | on   | test on  | if            |
         |------------+----+-------+------+----------+---------------|
@@ -177,18 +211,23 @@ def ls_bar(k, n, pixels, getcolor):
         | [oo      ] | 30 |       | i<2  |          |               |
         | [o       ] | 31 |       | i<1  |          |               |
     """
-    for i in range(n):
-        if k % (4 * n) < n:
-            pixels[i] = getcolor() if i < k % n else OFF
-        elif k % (4 * n) < 2 * n:
-            pixels[i] = getcolor() if i >= k % n else OFF
-        elif k % (4 * n) < 3 * n:
-            pixels[i] = getcolor() if i >= n - k % n else OFF
-        else:
-            pixels[i] = getcolor() if i < n - k % n else OFF
-
-
-def ls_binary(k, n, pixels, getcolor):
+    k, col = f.k, f.color
+    on = k % n
+    if k % (4 * n) < n:
+        for i in range(n):
+            pixels[i] = col if i < on else OFF
+    elif k % (4 * n) < 2 * n:
+        for i in range(n):
+            pixels[i] = col if i >= on else OFF
+    elif k % (4 * n) < 3 * n:
+        for i in range(n):
+            pixels[i] = col if i >= n - on else OFF
+    else:
+        for i in range(n):
+            pixels[i] = col if i < n - on else OFF
+
+
+def fx_binary(f, n, pixels):
     """0: [        ]
        1: [       O]
        2: [      O ]
@@ -197,11 +236,10 @@ def ls_binary(k, n, pixels, getcolor):
        ...
        n: [OOOOOOOO]
     """
-    for i, j in enumerate(reversed("{0:{fill}8b}".format(k % 2**n, fill='0'))):
-        pixels[i] = getcolor() if j == '1' else OFF
+    _pattern(f.k % 2**n, n, pixels, f.color)
 
 
-def ls_gray(k, n, pixels, getcolor):
+def fx_gray(f, n, pixels):
     """0: [        ]
        1: [       O]
        2: [      OO]
@@ -210,12 +248,11 @@ def ls_gray(k, n, pixels, getcolor):
        ...
        n: [OOOOOOOO]
     """
-    kk = k % 2**n
-    for i, j in enumerate(reversed("{0:{fill}8b}".format(kk ^ (kk >> 1), fill='0'))):
-        pixels[i] = getcolor() if j == '1' else OFF
+    kk = f.k % 2**n
+    _pattern(kk ^ (kk >> 1), n, pixels, f.color)
 
 
-def ls_pulse(k, n, pixels, getcolor):
+def fx_pulse(f, n, pixels):
     """0: [        ]
        1: [   OO   ]
        2: [  OOOO  ]
@@ -228,13 +265,13 @@ def ls_pulse(k, n, pixels, getcolor):
        9: [   OO   ]
        ...
     """
-    off = abs(n//2 - ((k - 1) % n))
+    col, off = f.color, abs(n//2 - ((f.k - 1) % n))
     for i in range(n):
-        pixels[i] = getcolor() if i >= off and i < n - off else OFF
+        pixels[i] = col if i >= off and i < n - off else OFF
 
 
 # TODO
-def ls_band(k, n, pixels, getcolor):
+def fx_band(f, n, pixels):
     """0: [        ]  1 4 0
        1: [   OO   ]  2 3 1
        2: [  O  O  ]  3 2 2
@@ -247,28 +284,73 @@ def ls_band(k, n, pixels, getcolor):
        9: [   OO   ]
        ...
     """
-    off = abs(n//2 - ((k - 1) % (n - 1)))
-    # print(k, off)
+    col, off = f.color, abs(n//2 - ((f.k - 1) % (n - 1)))
+    # print(f.k, off)
     for i in range(n):
-        pixels[i] = getcolor() if i == off or i == n - off else OFF
+        pixels[i] = col if i == off or i == n - off else OFF
 
 
-def ls_sine(k, n, pixels, getcolor):
+def fx_sine(f, n, pixels):
     """Sine wave"""
     # The constant 40 fixes the speed/resolution.
-    on = int((1 + sin(((2*3.1415926)/40) * (k % 40)))/2 * n)
+    col, on = f.color, int((1 + sin(((2*3.1415926)/40) * (f.k % 40)))/2 * n)
     for i in range(n):
-        pixels[i] = getcolor() if i == on else OFF
+        pixels[i] = col if i == on else OFF
 
 
-def ls_random(k, n, pixels, getcolor):
-    for i, j in enumerate("{0:{fill}8b}".format(getrandbits(n), fill='0')):
-        pixels[i] = getcolor() if j == '1' else OFF
+def fx_random(f, n, pixels):
+    """n random bits, the most significant bit at pixel 0"""
+    _pattern(getrandbits(n), n, pixels, f.color, True)
 
 
-def ls_rainbow(k, n, pixels, getcolor):
-    """A rainbow starting at k."""
-    # FIXME: document/explain constants
-    for i in range(n):
-        pixel_index = (i * 256 // n) + k
-        pixels[i] = colorwheel(pixel_index & 255)
+# effects with the classic arguments (k, n, pixels, getcolor)
+
+
+@effect(period=lambda n: n, batch=True)
+def ls_position(k, n, pixels, getcolor):
+    fx_position(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: n + 1, batch=True)
+def ls_unary(k, n, pixels, getcolor):
+    fx_unary(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: 2 * n, batch=True)
+def ls_strip(k, n, pixels, getcolor):
+    fx_strip(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: 4 * n, batch=True)
+def ls_bar(k, n, pixels, getcolor):
+    fx_bar(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: 2**n, batch=True)
+def ls_binary(k, n, pixels, getcolor):
+    fx_binary(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: 2**n, batch=True)
+def ls_gray(k, n, pixels, getcolor):
+    fx_gray(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: n, batch=True)
+def ls_pulse(k, n, pixels, getcolor):
+    fx_pulse(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: max(n - 1, 1), batch=True)
+def ls_band(k, n, pixels, getcolor):
+    fx_band(Frame(k, getcolor), n, pixels)
+
+
+@effect(period=lambda n: 40, batch=True)
+def ls_sine(k, n, pixels, getcolor):
+    fx_sine(Frame(k, getcolor), n, pixels)
+
+
+@effect(pure=False, batch=True)
+def ls_random(k, n, pixels, getcolor):
+    fx_random(Frame(k, getcolor), n, pixels)
@@ -5,10 +5,32 @@
 # Emulates a NeoPixel strip.
 #
 # Usage: ./emulator.py
+#        ./emulator.py --headless --frames 1000 ls_bar
 #
 # Author: rja
 #
 # Changes:
+# 2026-10-18 (rja)
+# - added optional frame cache for periodic effects
+# - store pixels in a compact PixelBuffer (effects render into a list
+#   that is packed into it once per frame)
+# - redraw only changed pixels and skip unchanged frames
+# - added headless mode for benchmarking (no window, no delay)
+# - several functions split the strip into segments (compositor.py)
+# - added asyncio event loop (asyncrunner.py)
+# - record and play show files (showfile.py)
+# - receive pixels via DDP over UDP (ddp.py)
+# - optional brightness and gamma correction (gamma.py), up/down keys
+#   change the brightness
+# - input-to-photon latency (latency.py), key l prints it
+# - optional per-effect profiling (profiling.py) shown in the window
+#   title, key p prints a report
+# - effects from the registry (registry.py)
+# - 2D matrices shown as grid (matrix.py), 1D effects along rows,
+#   columns or the serpentine path
+# - large strips are drawn into a surface with one texel per LED that
+#   is scaled into the window with one blit (long strips wrap into
+#   several rows)
 # 2024-01-04 (rja)
 # - added automatic stepping with configurable delay
 # 2022-01-03 (rja)
@@ -17,46 +39,202 @@
 # - initial version
 
 import sys
-import sdl2.ext
 import demos
+import registry
+import matrix
+import cache
+import compositor
+import asyncrunner
+import asyncio
+import pixelbuffer
+import showfile
+import ddp
+import gamma
+import latency
+import profiling
+import select
 import argparse
 import time
 
-version = "0.0.3"
+version = "0.0.4"
+
+sdl2 = None     # imported on demand such that headless mode works without SDL
+
+
+def _import_sdl():
+    global sdl2
+    import sdl2.ext
+
+
+def percentile(values, p):
+    """Returns the p-th percentile (nearest rank) of sorted values."""
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
 
 
 class NeoPixelEmulator():
 
     led_size = 40
     gap_size = 2
+    chunk_size = 64     # pixels compared at once when looking for changes
+    blit_size = 512     # strips with more pixels use a single blit
+    max_window = (1600, 1000)
 
-    def __init__(self, size):
-        self.data = [(0, 0, 0) for i in range(size)]
+    def __init__(self, size, cachesize=0, byteorder="GRB", headless=False, layout=None, blit=None):
+        self.cache = cache.FrameCache(cachesize) if cachesize > 0 else None
+        self.frame = [demos.OFF] * size             # the effects render into this list
+        self.data = pixelbuffer.PixelBuffer(size, byteorder)
+        self.shown = bytearray(len(self.data.buf))  # last presented frame
+        self.pixels_drawn = 0                       # number of redrawn pixels
+        self.frames_shown = 0                       # number of presented frames
+        self.frames_skipped = 0                     # number of unchanged frames
+        self.recorder = None                        # showfile.ShowWriter
+        self.lut = None                             # gamma.LUT
+        self.out = bytearray(len(self.data.buf))    # corrected pixels
+        self.latency = latency.Latency()            # input to shown frame
+        self.profiler = None                        # profiling.Profiler
+        self.title_time = 0                         # last update of the title
+        self.texels = None                          # one texel per LED (blit)
+
+        self.window = None
+        if headless:
+            return
 
         # init SDL window
+        _import_sdl()
         sdl2.ext.init()
-        width = len(self.data) * (self.led_size + self.gap_size) + self.gap_size
-        height = self.led_size + 2*self.gap_size
+        if blit is None:
+            blit = size > self.blit_size
+        if blit:
+            try:
+                width, height = self._init_blit(size, layout)
+            except ImportError:                     # no NumPy
+                blit = False
+        if not blit:
+            width, height = self._init_squares(size, layout)
         self.window = sdl2.ext.Window("NeoPixel Emulator", size=(width, height))
         self.surface = self.window.get_surface()
         sdl2.ext.fill(self.surface, 0)
         self.window.show()
 
+    def _init_squares(self, size, layout):
+        """Draws every LED as a square; returns the window size."""
+        # top left corner of every LED (a single row or the matrix layout)
+        step = self.led_size + self.gap_size
+        if layout is None:
+            self.corners = [(self.gap_size + i * step, self.gap_size) for i in range(size)]
+            width, height = size * step + self.gap_size, step + self.gap_size
+        else:
+            self.corners = [(self.gap_size + x * step, self.gap_size + y * step) for x, y in layout.xy]
+            width, height = layout.width * step + self.gap_size, layout.height * step + self.gap_size
+        return width, height
+
+    def _init_blit(self, size, layout):
+        """Draws the LEDs into a surface with one texel per LED that is
+        scaled to the window; returns the window size."""
+        import numpy as np
+        self.np = np
+        maxw, maxh = self.max_window
+        if layout is None:
+            # wrap into rows: the largest LEDs such that all fit
+            for scale in range(self.led_size + self.gap_size, 0, -1):
+                columns = min(size, max(maxw // scale, 1))
+                rows = -(-size // columns)
+                if rows * scale <= maxh:
+                    break
+            xs, ys = np.arange(size) % columns, np.arange(size) // columns
+        else:
+            columns, rows = layout.width, layout.height
+            scale = max(1, min(self.led_size + self.gap_size, maxw // columns, maxh // rows))
+            xs, ys = np.array(layout.xy).T
+        self.texels = sdl2.SDL_CreateRGBSurfaceWithFormat(0, columns, rows, 32, sdl2.SDL_PIXELFORMAT_RGB888)
+        self.texview = sdl2.ext.pixels2d(self.texels.contents)    # [x, y]
+        self.texpos = (xs, ys)
+        self.dest = sdl2.SDL_Rect(0, 0, columns * scale, rows * scale)
+        return columns * scale, rows * scale
+
+    def _blit(self, buf):
+        np = self.np
+        pixels = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 3).astype(np.uint32)
+        r, g, b = self.data.offsets
+        self.texview[self.texpos] = (pixels[:, r] << 16) | (pixels[:, g] << 8) | pixels[:, b]
+        sdl2.SDL_BlitScaled(self.texels, None, self.surface, self.dest)
+
     def show(self):
-        x = self.gap_size
-        for col in self.data:
-            self._draw_square(x, col)
-            x += self.led_size + self.gap_size
+        """Draws the pixels that changed since the last presented frame
+        and skips the refresh if nothing changed."""
+        changed = self._present()
+        self.latency.shown()
+        return changed
 
-    def _draw_square(self, x, col):
-        rect = [x, self.gap_size, self.led_size, self.led_size]
+    def _present(self):
+        if self.recorder is not None:
+            self.recorder.write(self.data)
+        buf, shown = self.data.buf, self.shown
+        if buf == shown:
+            self.frames_skipped += 1
+            return False
+        if self.lut is not None:
+            self.lut.apply(buf, self.out, self.data.byteorder)
+        if self.window is None:                     # headless
+            shown[:] = buf
+            self.frames_shown += 1
+            return True
+        if self.texels is not None:
+            self._blit(buf if self.lut is None else self.out)
+            shown[:] = buf
+            self.pixels_drawn += len(self.data)
+            self.frames_shown += 1
+            self.window.refresh()
+            return True
+        chunk = 3 * self.chunk_size
+        for start in range(0, len(buf), chunk):
+            if buf[start:start + chunk] == shown[start:start + chunk]:
+                continue
+            for o in range(start, min(start + chunk, len(buf)), 3):
+                if buf[o:o + 3] != shown[o:o + 3]:
+                    i = o // 3
+                    self._draw_square(i, self._color(i))
+                    self.pixels_drawn += 1
+        shown[:] = buf
+        self.frames_shown += 1
+        self.window.refresh()
+        return True
+
+    def _color(self, i):
+        """Returns the (corrected) color of pixel i."""
+        if self.lut is None:
+            return self.data[i]
+        o = 3 * i
+        r, g, b = self.data.offsets
+        return (self.out[o + r], self.out[o + g], self.out[o + b])
+
+    def set_brightness(self, brightness, gammas=(2.2, 2.2, 2.2)):
+        """Enables the lookup table and redraws all pixels if the
+        brightness changed."""
+        if self.lut is None:
+            self.lut = gamma.LUT(brightness, gammas)
+        elif brightness == self.lut.brightness:
+            return
+        self.lut.set_brightness(brightness)
+        self.shown = bytearray(b ^ 0xff for b in self.data.buf)
+
+    def stamp(self, event):
+        """Stamps an SDL keyboard event as input for the latency
+        measurement (at the time SDL received it)."""
+        self.latency.input(time.monotonic_ns() - (sdl2.SDL_GetTicks() - event.key.timestamp) * 1000000)
+
+    def _draw_square(self, i, col):
+        x, y = self.corners[i]
+        rect = [x, y, self.led_size, self.led_size]
         color = sdl2.ext.Color(col[0], col[1], col[2])
         sdl2.ext.fill(self.surface, color, rect)
 
     def __repr__(self):
         return str(self.data)
 
-    def run(self, func, getcolor, step=False, delay=0.05):
+    def run(self, func, getcolor, step=False, delay=0.05, frames=1000):
+        if self.window is None:
+            return self.run_headless(func, getcolor, frames)
         running = True
         position = 0
         # FIXME: use interrupts
@@ -68,49 +246,257 @@ class NeoPixelEmulator():
                     break
                 if event.type == sdl2.SDL_KEYDOWN:
                     if event.key.keysym.sym == sdl2.SDLK_LEFT:
+                        self.stamp(event)
                         position -= 1
                         self.set(position, func, getcolor)
                     elif event.key.keysym.sym == sdl2.SDLK_RIGHT:
+                        self.stamp(event)
                         position += +1
                         self.set(position, func, getcolor)
+                    elif event.key.keysym.sym in (sdl2.SDLK_UP, sdl2.SDLK_DOWN):
+                        self.stamp(event)
+                        delta = 0.05 if event.key.keysym.sym == sdl2.SDLK_UP else -0.05
+                        self.set_brightness((self.lut.brightness if self.lut else 1.0) + delta)
+                        self.latency.rendered()
+                        self.show()
+                    elif event.key.keysym.sym == sdl2.SDLK_l:
+                        print(self.latency)
+                    elif event.key.keysym.sym == sdl2.SDLK_p and self.profiler:
+                        print(self.profiler.report())
                     elif event.key.keysym.sym == sdl2.SDLK_ESCAPE:
                         running = False
                         break
             if not step:
                 # step automatically through all steps
                 position += 1
+                t = time.monotonic_ns()
                 time.sleep(delay)
+                if self.profiler:
+                    self.profiler.add(func, "sleep", t)
                 self.set(position, func, getcolor)
-            self.window.refresh()
+            if self.profiler:
+                self._title(func)
+        sdl2.ext.quit()
+        print(self.stats())
+        print(self.latency)
+        if self.profiler:
+            print(self.profiler.report())
+        if self.cache is not None:
+            print(self.cache)
+        return 0
+
+    def run_headless(self, func, getcolor, frames):
+        """Renders frames as fast as possible and reports the timing."""
+        times = []
+        start = time.perf_counter()
+        for position in range(1, frames + 1):
+            t = time.perf_counter()
+            self.set(position, func, getcolor)
+            times.append(time.perf_counter() - t)
+        total = time.perf_counter() - start
+        times.sort()
+        print("{}: {} frames, {} pixels in {:.3f} s = {:.1f} frames/s".format(
+            func.__name__, frames, len(self.data), total, frames / total))
+        print("frame time (ms): p50 {:.3f}, p95 {:.3f}, p99 {:.3f}, max {:.3f}".format(
+            *[1000 * percentile(times, p) for p in (50, 95, 99, 100)]))
+        print(self.stats())
+        if self.profiler:
+            print(self.profiler.report())
+        if self.cache is not None:
+            print(self.cache)
+        return 0
+
+    def _title(self, func, interval=0.5):
+        """Shows the profile of func in the window title."""
+        now = time.monotonic()
+        if now - self.title_time >= interval:
+            self.title_time = now
+            sdl2.SDL_SetWindowTitle(self.window.window, self.profiler.summary(func).encode())
+
+    def stats(self):
+        return "frames shown: {}, frames skipped: {}, pixels drawn: {}".format(
+            self.frames_shown, self.frames_skipped, self.pixels_drawn)
+
+    def play(self, show, loop=False):
+        """Plays the frames of a show file (see showfile.py); left and
+        right seek by one second."""
+        if self.window is None:
+            start = time.perf_counter()
+            for i in range(len(show)):
+                show.load(i, self.data)
+                self.show()
+            total = time.perf_counter() - start
+            print("{} frames, {} pixels in {:.3f} s = {:.1f} frames/s".format(
+                len(show), show.n, total, len(show) / total))
+            print(self.stats())
+            return 0
+        delay = 1 / show.fps
+        deadline = time.monotonic()
+        running = True
+        i = 0
+        while running and (loop or i < len(show)):
+            for event in sdl2.ext.get_events():
+                if event.type == sdl2.SDL_QUIT:
+                    running = False
+                elif event.type == sdl2.SDL_KEYDOWN:
+                    if event.key.keysym.sym == sdl2.SDLK_LEFT:
+                        i = max(i - int(show.fps), 0)
+                    elif event.key.keysym.sym == sdl2.SDLK_RIGHT:
+                        i += int(show.fps)
+                    elif event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+                        running = False
+            show.load(i % len(show), self.data)
+            self.show()
+            i += 1
+            deadline += delay
+            time.sleep(max(0, deadline - time.monotonic()))
         sdl2.ext.quit()
+        print(self.stats())
         return 0
 
+    def listen(self, receiver, poll=0.01):
+        """Shows the frames a ddp.Receiver gets until the window is
+        closed (or Ctrl-C)."""
+        running = True
+        try:
+            while running:
+                select.select([receiver], [], [], poll)
+                if receiver.poll() > 0:
+                    self.show()
+                if self.window is not None:
+                    for event in sdl2.ext.get_events():
+                        if event.type == sdl2.SDL_QUIT or (event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE):
+                            running = False
+        except KeyboardInterrupt:
+            pass
+        if self.window is not None:
+            sdl2.ext.quit()
+        receiver.close()
+        print(receiver)
+        print(self.stats())
+        return 0
+
+    def run_async(self, func, getcolor, step=False, delay=0.05, fps=60, stdin=False):
+        """Like run() but with an asyncio event loop (see asyncrunner.py)."""
+        runner = asyncrunner.Runner([asyncrunner.Strip(self, func, getcolor, delay, step)], fps)
+
+        async def main():
+            if stdin:
+                asyncrunner.stdin_source(runner)
+            return await runner.run()
+
+        ret = asyncio.run(main())
+        if self.window is not None:
+            sdl2.ext.quit()
+        print(self.stats())
+        return ret
+
+    def render(self, pos, func, getcolor):
+        """Renders the effect into the pixel buffer (without showing it)."""
+        if self.cache is not None:
+            self.cache.set(pos, func, len(self.frame), self.frame, getcolor)
+        else:
+            func(pos, len(self.frame), self.frame, getcolor)
+        self.data.pack(self.frame)
+        self.latency.rendered()
+
     def set(self, pos, func, getcolor):
-        func(pos, len(self.data), self.data, getcolor)
+        if self.profiler is None:
+            self.render(pos, func, getcolor)
+            self.show()
+            return
+        t = self.profiler.clock()
+        self.render(pos, func, getcolor)
+        t = self.profiler.add(func, "render", t)
         self.show()
+        self.profiler.add(func, "show", t)
 
     def list_functions(self):
-        for fn in dir(demos):
-            if fn.startswith("ls_"):
-                print(" ", fn)
+        for fn in registry.names():
+            print(" ", fn)
 
 
 if __name__ == '__main__':
 
     parser = argparse.ArgumentParser(description='Emulate a NeoPixel and a Rotary Encoder.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
-    parser.add_argument('function', type=str, help='function to test', nargs='*')
+    parser.add_argument('function', type=str, help='function to test (several functions split the strip)', nargs='*')
     parser.add_argument('-c', '--color', choices=["col_const", "col_rand"], help='function for color', default="col_const")
     parser.add_argument('-s', '--size', type=int, metavar="NUM", help='number of LEDs', default=8)
     parser.add_argument('-d', '--delay', type=float, metavar="D", help='time delay', default=0.05)
+    parser.add_argument('-o', '--order', choices=["GRB", "RGB"], help='byte order of the pixel buffer', default="GRB")
+    parser.add_argument('--cache', type=int, metavar="BYTES", help='memory limit of the frame cache (0 = no cache)', default=0)
     parser.add_argument('--step', action="store_true", help='step through')
+    parser.add_argument('--headless', action="store_true", help='render without window and delay and report the frame rate')
+    parser.add_argument('--async', dest="asyncio", action="store_true", help='run with an asyncio event loop')
+    parser.add_argument('--fps', type=float, metavar="FPS", help='frame rate of the asyncio event loop', default=60)
+    parser.add_argument('--stdin', action="store_true", help='read steps from stdin (+, -, q) with --async')
+    parser.add_argument('--record', type=str, metavar="FILE", help='record the shown frames into a show file')
+    parser.add_argument('--play', type=str, metavar="FILE", help='play a show file')
+    parser.add_argument('--loop', action="store_true", help='play the show file in a loop')
+    parser.add_argument('--listen', type=int, metavar="PORT", help='show pixels received via DDP on this UDP port')
+    parser.add_argument('--bind', type=str, metavar="HOST", help='address to listen on', default="127.0.0.1")
+    parser.add_argument('-b', '--brightness', type=float, metavar="B", help='brightness (0..1) using a lookup table')
+    parser.add_argument('-g', '--gamma', type=float, metavar="G", help='gamma correction (per channel: R G B)', nargs='+')
+    parser.add_argument('-m', '--matrix', type=str, metavar="WxH", help='LED matrix (size of one panel)')
+    parser.add_argument('--panels', type=str, metavar="CxR", help='tiled matrix panels', default="1x1")
+    parser.add_argument('--wiring', choices=["serpentine", "progressive"], help='wiring of the matrix rows', default="serpentine")
+    parser.add_argument('--vertical', action="store_true", help='matrix wired column by column')
+    parser.add_argument('--snake', action="store_true", help='every other row of panels is chained right to left')
+    parser.add_argument('--along', choices=["rows", "columns", "path"], help='run 1D effects along the rows, columns or path of the matrix')
+    parser.add_argument('--shift', type=int, metavar="K", help='shift of k from line to line (--along)', default=0)
+    parser.add_argument('--blit', choices=["auto", "on", "off"], help='draw all LEDs with one scaled blit (auto: more than {} LEDs)'.format(NeoPixelEmulator.blit_size), default="auto")
+    parser.add_argument('-p', '--profile', action="store_true", help='profile render, show and sleep time (window title, key p)')
+    parser.add_argument('-n', '--frames', type=int, metavar="NUM", help='number of frames in headless mode', default=1000)
     parser.add_argument('-v', '--version', action="version", version="%(prog)s " + version)
 
     args = parser.parse_args()
 
-    npe = NeoPixelEmulator(args.size)
+    if args.play:
+        show = showfile.Show(args.play)
+        npe = NeoPixelEmulator(show.n, 0, show.byteorder, args.headless)
+        sys.exit(npe.play(show, args.loop))
+
+    layout = None
+    if args.matrix:
+        width, height = (int(v) for v in args.matrix.split("x"))
+        columns, rows = (int(v) for v in args.panels.split("x"))
+        layout = matrix.tiled(width, height, columns, rows, args.wiring == "serpentine", args.vertical, args.snake)
+        args.size = layout.n
+
+    npe = NeoPixelEmulator(args.size, args.cache, args.order, args.headless, layout,
+                           {"auto": None, "on": True, "off": False}[args.blit])
+    if args.profile:
+        npe.profiler = profiling.Profiler(registry.names(), budget=None if args.headless else args.delay)
+    if args.brightness is not None or args.gamma:
+        gammas = args.gamma or [2.2]
+        npe.set_brightness(1.0 if args.brightness is None else args.brightness, (gammas * 3)[:3] if len(gammas) == 1 else gammas)
+    if args.record:
+        npe.recorder = showfile.ShowWriter(args.record, args.size, args.order,
+                                           args.fps if args.asyncio else 1 / args.delay)
+
+    if args.listen:
+        sys.exit(npe.listen(ddp.Receiver(npe.data, args.bind, args.listen)))
 
     if len(args.function) == 0:
         print("Expected the name of an effect as argument. Please choose:")
         npe.list_functions()
     else:
-        sys.exit(npe.run(getattr(demos, args.function[0]), getattr(demos, args.color), args.step, args.delay))
+        funcs = []
+        for fn in args.function:
+            if layout and fn in matrix.effects:
+                funcs.append(matrix.effects[fn](layout))
+            elif layout and args.along:
+                funcs.append(matrix.along(layout, registry.get(fn), args.along, args.shift))
+            else:
+                funcs.append(registry.get(fn))
+        if len(funcs) == 1:
+            func = funcs[0]
+        else:
+            func = compositor.split(args.size, funcs)
+        if args.asyncio:
+            ret = npe.run_async(func, getattr(demos, args.color), args.step, args.delay, args.fps, args.stdin)
+        else:
+            ret = npe.run(func, getattr(demos, args.color), args.step, args.delay, args.frames)
+        if npe.recorder is not None:
+            npe.recorder.close()
+        sys.exit(ret)
@@ -0,0 +1,310 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Offline export of effects as animated images, sprite sheets or raw
+# video.
+#
+# Renders frames of an effect with batch.py (in blocks, without display
+# and delay) and streams every frame to a writer as soon as it is
+# rendered, so memory does not grow with the number of frames:
+# - gif: animated GIF (own LZW encoder, exact colors for up to 256
+#   colors per frame, RGB 3-3-2 otherwise)
+# - apng: animated PNG (lossless)
+# - sheet: PNG sprite sheet with the frames from top to bottom
+# - raw: RGB24 frames (e.g., to stdout for an encoder like ffmpeg)
+# Every LED becomes a square of scale x scale pixels; long strips wrap
+# into rows of --columns LEDs.
+#
+# Usage: ./export.py -s 64 -n 256 -o bar.gif ls_bar
+#        ./export.py -s 64 -n 256 -f sheet -o bar.png ls_bar
+#        ./export.py -s 300 -n 600 -o - ls_rainbow | ffmpeg -f rawvideo \
+#            -pixel_format rgb24 -video_size 1200x4 -framerate 60 -i - rainbow.mp4
+#
+# (host only, requires NumPy)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import sys
+import time
+import zlib
+import struct
+import random
+import argparse
+
+import numpy as np
+
+import demos
+import batch
+import registry
+
+version = "0.0.1"
+
+# frames rendered by one call of batch.render
+block_size = 64
+
+formats = ["gif", "apng", "sheet", "raw"]
+
+
+def frames(func, n, getcolor, start, count, columns, scale):
+    """Yields count images (height, width, 3) of func starting at
+    k = start."""
+    columns = min(columns or n, n)
+    rows = -(-n // columns)
+    for first in range(start, start + count, block_size):
+        block = batch.render(func, range(first, min(first + block_size, start + count)), n, getcolor)
+        if rows * columns > n:
+            block = np.concatenate((block, np.zeros((len(block), rows * columns - n, 3), np.uint8)), axis=1)
+        block = block.reshape(len(block), rows, columns, 3)
+        if scale > 1:
+            block = block.repeat(scale, axis=1).repeat(scale, axis=2)
+        yield from block
+
+
+class RawWriter():
+
+    def __init__(self, out, width, height, count, fps):
+        self.out = out
+
+    def write(self, image):
+        self.out.write(image.tobytes())
+
+    def close(self):
+        self.out.flush()
+
+
+def _chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def _scanlines(image):
+    """Image data of a PNG: every row preceded by filter type 0."""
+    height, width = image.shape[:2]
+    data = np.zeros((height, 3 * width + 1), np.uint8)
+    data[:, 1:] = image.reshape(height, 3 * width)
+    return data.tobytes()
+
+
+class PNGWriter():
+
+    signature = b"\x89PNG\r\n\x1a\n"
+
+    def __init__(self, out, width, height):
+        self.out = out
+        out.write(self.signature)
+        out.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+
+    def close(self):
+        self.out.write(_chunk(b"IEND", b""))
+        self.out.flush()
+
+
+class SheetWriter(PNGWriter):
+    """One PNG with all frames; the image data is compressed as a stream
+    that is written in IDAT chunks while the frames arrive."""
+
+    def __init__(self, out, width, height, count, fps):
+        super().__init__(out, width, height * count)
+        self.compressor = zlib.compressobj(6)
+
+    def write(self, image):
+        data = self.compressor.compress(_scanlines(image))
+        if data:
+            self.out.write(_chunk(b"IDAT", data))
+
+    def close(self):
+        self.out.write(_chunk(b"IDAT", self.compressor.flush()))
+        super().close()
+
+
+class APNGWriter(PNGWriter):
+    """Animated PNG: the first frame is the default image (IDAT), the
+    others follow in fdAT chunks."""
+
+    def __init__(self, out, width, height, count, fps):
+        super().__init__(out, width, height)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.seq = 0            # sequence number of fcTL and fdAT chunks
+        self.count = 0
+        out.write(_chunk(b"acTL", struct.pack(">II", count, 0)))
+
+    def write(self, image):
+        # delay as a fraction of a second: 1/fps (for integer fps)
+        delay = struct.pack(">HH", 1, int(self.fps)) if self.fps == int(self.fps) else struct.pack(">HH", int(1000 / self.fps + 0.5), 1000)
+        self.out.write(_chunk(b"fcTL", struct.pack(">IIIII", self.seq, self.width, self.height, 0, 0) + delay + b"\0\0"))
+        self.seq += 1
+        data = zlib.compress(_scanlines(image), 6)
+        if self.count == 0:
+            self.out.write(_chunk(b"IDAT", data))
+        else:
+            self.out.write(_chunk(b"fdAT", struct.pack(">I", self.seq) + data))
+            self.seq += 1
+        self.count += 1
+
+
+def lzw(indices, bits):
+    """Compresses indices (bytes) with the variable-length LZW of GIF for
+    a minimum code size of bits."""
+    clear = 1 << bits
+    size = bits + 1
+    nextcode = clear + 2
+    table = {}
+    out = bytearray()
+    acc = clear             # bit accumulator (starts with a clear code)
+    accbits = size
+    it = iter(indices)
+    prefix = next(it)
+    for c in it:
+        key = prefix << 8 | c
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        acc |= prefix << accbits
+        accbits += size
+        while accbits >= 8:
+            out.append(acc & 0xff)
+            acc >>= 8
+            accbits -= 8
+        if nextcode >= 1 << size:
+            size += 1
+        if nextcode < 4095:
+            table[key] = nextcode
+            nextcode += 1
+        else:               # table full: start over
+            acc |= clear << accbits
+            accbits += size
+            table.clear()
+            size = bits + 1
+            nextcode = clear + 2
+        prefix = c
+    acc |= prefix << accbits
+    accbits += size
+    if nextcode >= 1 << size:
+        size += 1
+    acc |= (clear + 1) << accbits
+    accbits += size
+    while accbits > 0:
+        out.append(acc & 0xff)
+        acc >>= 8
+        accbits -= 8
+    return out
+
+
+def _quantize(image):
+    """Returns (indices, palette, bits) of image: the exact colors if
+    there are at most 256, RGB 3-3-2 otherwise."""
+    rgb = image.reshape(-1, 3).astype(np.uint32)
+    packed = rgb[:, 0] << 16 | rgb[:, 1] << 8 | rgb[:, 2]
+    colors, indices = np.unique(packed, return_inverse=True)
+    if len(colors) > 256:
+        indices = (rgb[:, 0] & 0xe0) | (rgb[:, 1] & 0xe0) >> 3 | rgb[:, 2] >> 6
+        v = np.arange(256, dtype=np.uint32)
+        colors = ((v >> 5) * 255 // 7) << 16 | ((v >> 2 & 7) * 255 // 7) << 8 | (v & 3) * 85
+    bits = max(2, (len(colors) - 1).bit_length())
+    palette = np.zeros((1 << bits, 3), np.uint8)
+    palette[:len(colors)] = np.stack((colors >> 16, colors >> 8 & 0xff, colors & 0xff), axis=1)
+    return indices.astype(np.uint8).tobytes(), palette.tobytes(), bits
+
+
+class GIFWriter():
+    """Animated GIF with a local color table per frame; the delays (in
+    1/100 s) are rounded such that the errors do not add up."""
+
+    def __init__(self, out, width, height, count, fps):
+        self.out = out
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.count = 0
+        out.write(b"GIF89a" + struct.pack("<HHBBB", width, height, 0, 0, 0))
+        # loop forever
+        out.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def write(self, image):
+        indices, palette, bits = _quantize(image)
+        delay = int(100 * (self.count + 1) / self.fps + 0.5) - int(100 * self.count / self.fps + 0.5)
+        self.count += 1
+        out = self.out
+        out.write(b"\x21\xf9\x04\x00" + struct.pack("<H", delay) + b"\x00\x00")
+        out.write(b"\x2c" + struct.pack("<HHHHB", 0, 0, self.width, self.height, 0x80 | (bits - 1)))
+        out.write(palette)
+        data = lzw(indices, bits)
+        out.write(bytes([bits]))
+        for i in range(0, len(data), 255):
+            block = data[i:i + 255]
+            out.write(bytes([len(block)]) + block)
+        out.write(b"\x00")
+
+    def close(self):
+        self.out.write(b"\x3b")
+        self.out.flush()
+
+
+writers = {
+    "gif": GIFWriter,
+    "apng": APNGWriter,
+    "sheet": SheetWriter,
+    "raw": RawWriter,
+}
+
+
+def export(out, fmt, func, n, getcolor, count, start=0, columns=None, scale=4, fps=30):
+    """Renders count frames of func into the file object out; returns
+    the size (width, height) of a frame."""
+    columns = min(columns or n, n)
+    width, height = columns * scale, -(-n // columns) * scale
+    writer = writers[fmt](out, width, height, count, fps)
+    for image in frames(func, n, getcolor, start, count, columns, scale):
+        writer.write(image)
+    writer.close()
+    return width, height
+
+
+def guess_format(path):
+    if path == "-" or path.endswith((".rgb", ".raw")):
+        return "raw"
+    if path.endswith(".png"):
+        return "apng"
+    return "gif"
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Export an effect as animated GIF/PNG, sprite sheet or raw RGB video.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('function', type=str, help='effect to export')
+    parser.add_argument('-o', '--output', type=str, metavar="FILE", help='output file (- = stdout)', required=True)
+    parser.add_argument('-f', '--format', choices=formats, help='output format (default: from the file name: .gif, .png = apng, .rgb/.raw/- = raw)')
+    parser.add_argument('-c', '--color', choices=["col_const", "col_rand"], help='function for color', default="col_const")
+    parser.add_argument('-s', '--size', type=int, metavar="NUM", help='number of LEDs', default=8)
+    parser.add_argument('-n', '--frames', type=int, metavar="NUM", help='number of frames', default=256)
+    parser.add_argument('-k', '--start', type=int, metavar="K", help='first value of k', default=0)
+    parser.add_argument('--columns', type=int, metavar="NUM", help='LEDs per row (default: all)')
+    parser.add_argument('--scale', type=int, metavar="PX", help='size of an LED in pixels', default=4)
+    parser.add_argument('--fps', type=float, metavar="FPS", help='frame rate', default=30)
+    parser.add_argument('--seed', type=int, metavar="NUM", help='seed for random effects', default=0)
+    parser.add_argument('-v', '--version', action="version", version="%(prog)s " + version)
+
+    args = parser.parse_args()
+
+    if args.function not in registry.names():
+        sys.exit("unknown effect: " + args.function)
+
+    fmt = args.format or guess_format(args.output)
+    random.seed(args.seed)
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+
+    start = time.perf_counter()
+    with out:
+        width, height = export(out, fmt, registry.get(args.function), args.size, getattr(demos, args.color),
+                               args.frames, args.start, args.columns, args.scale, args.fps)
+    elapsed = time.perf_counter() - start
+    # stdout may carry the frames
+    print("{}: {} frames of {}x{} ({}) in {:.3f} s = {:.1f} frames/s".format(
+        args.function, args.frames, width, height, fmt, elapsed, args.frames / elapsed), file=sys.stderr)
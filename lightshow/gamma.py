@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Gamma correction and brightness with lookup tables.
+#
+# Combines brightness and per-channel gamma into one precomputed table
+# with 256 entries per channel that is applied to a whole frame buffer
+# at once:
+# - color(): one color; the device corrects the colors of a frame and
+#   the palettes (see palette.correct), such that NeoPixel shows the
+#   pixels unchanged
+# - apply(): bytearray path (bytes.translate on the host, a loop on
+#   CircuitPython which lacks translate)
+# - apply_array(): vectorized path for NumPy arrays (e.g., from
+#   batch.render)
+# The tables are rebuilt only when the brightness changes.
+#
+# Usage: import as a module
+#
+#   lut = gamma.LUT(0.25)
+#   lut.apply(pixels.buf, out, pixels.byteorder)
+#   col = lut.color((255, 0, 0))
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class LUT():
+
+    def __init__(self, brightness=1.0, gamma=(2.2, 2.2, 2.2)):
+        self.gamma = gamma          # exponent for red, green and blue
+        self.brightness = None
+        self.builds = 0             # number of (re-)builds of the tables
+        self.set_brightness(brightness)
+
+    def set_brightness(self, brightness):
+        """Sets the brightness (0..1) and rebuilds the tables if it
+        changed."""
+        brightness = min(max(brightness, 0.0), 1.0)
+        if brightness == self.brightness:
+            return
+        self.brightness = brightness
+        self.tables = [bytes(int(255 * brightness * (i / 255) ** g + 0.5) for i in range(256))
+                       for g in self.gamma]
+        self.uniform = self.gamma[0] == self.gamma[1] == self.gamma[2]
+        self.array = None           # NumPy version, see apply_array
+        self.builds += 1
+
+    def color(self, col):
+        """Returns the corrected (r, g, b) color."""
+        return (self.tables[0][col[0]], self.tables[1][col[1]], self.tables[2][col[2]])
+
+    def apply(self, buf, out=None, byteorder="RGB"):
+        """Writes the corrected pixels from buf (bytes in byteorder) into
+        out (default: buf) and returns out."""
+        if out is None:
+            out = buf
+        try:
+            if self.uniform:
+                out[:] = buf.translate(self.tables[0])
+            else:
+                for c, table in zip("RGB", self.tables):
+                    o = byteorder.index(c)
+                    out[o::3] = buf[o::3].translate(table)
+        except AttributeError:      # no bytes.translate (CircuitPython)
+            for c, table in zip("RGB", self.tables):
+                for i in range(byteorder.index(c), len(buf), 3):
+                    out[i] = table[buf[i]]
+        return out
+
+    def apply_array(self, frames):
+        """Returns corrected frames (NumPy uint8 array, last axis RGB)."""
+        import numpy as np
+        if self.array is None:
+            self.array = np.frombuffer(b"".join(self.tables), dtype=np.uint8).reshape(3, 256)
+        return self.array[np.arange(3), frames]
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the adafruit_debouncer library (same algorithm as
+# the original: a new state is taken over when it was stable for
+# interval seconds at the time of update()).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import time
+import hostinput
+
+
+class Debouncer():
+
+    def __init__(self, io, interval=0.010):
+        self.io = io
+        self.interval = interval
+        self.counter = hostinput.Counter("debouncer", io.name)
+        self.state = self.unsettled = io.value
+        self.changed_at = time.monotonic()
+        self.changed = False
+        hostinput.get().register(io.name + " (debounced)", self)
+
+    def update(self):
+        self.changed = False
+        value = self.io.value
+        now = time.monotonic()
+        if value != self.unsettled:
+            self.unsettled = value
+            self.changed_at = now
+        elif value != self.state and now - self.changed_at >= self.interval:
+            self.state = value
+            self.changed = True
+            self.counter.seen += 1
+
+    @property
+    def value(self):
+        return self.state
+
+    @property
+    def rose(self):
+        return self.state and self.changed
+
+    @property
+    def fell(self):
+        return not self.state and self.changed
+
+    def report(self):
+        self.counter.events = self.io.counter.events
+        return [repr(self.counter)]
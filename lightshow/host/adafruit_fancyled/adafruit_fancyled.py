@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the adafruit_fancyled library (CRGB and CHSV only).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import colorsys
+
+
+class CHSV():
+    """Hue, saturation and value as floats 0..1 (ints 0..255)."""
+
+    def __init__(self, h, s=1.0, v=1.0):
+        self.hue = h / 255 if isinstance(h, int) else h % 1.0
+        self.saturation = s / 255 if isinstance(s, int) else s
+        self.value = v / 255 if isinstance(v, int) else v
+
+
+class CRGB():
+    """Red, green and blue as floats 0..1 (ints 0..255)."""
+
+    def __init__(self, red, green=0.0, blue=0.0):
+        if isinstance(red, CHSV):
+            red, green, blue = colorsys.hsv_to_rgb(red.hue, red.saturation, red.value)
+        self.red, self.green, self.blue = (c / 255 if isinstance(c, int) else c for c in (red, green, blue))
+
+    def __iter__(self):
+        return iter((self.red, self.green, self.blue))
+
+    def pack(self):
+        return int(self.red * 255) << 16 | int(self.green * 255) << 8 | int(self.blue * 255)
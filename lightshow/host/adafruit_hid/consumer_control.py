@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_hid.consumer_control: prints the codes.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from adafruit_hid.consumer_control_code import ConsumerControlCode
+
+
+class ConsumerControl():
+
+    def __init__(self, devices):
+        pass
+
+    def send(self, consumer_code):
+        print("consumer control:", ConsumerControlCode.names.get(consumer_code, consumer_code))
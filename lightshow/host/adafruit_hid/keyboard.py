@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_hid.keyboard: prints the keys.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from adafruit_hid.keycode import Keycode
+
+
+class Keyboard():
+
+    def __init__(self, devices):
+        self.pressed = set()
+
+    def press(self, *keycodes):
+        self.pressed.update(keycodes)
+
+    def release(self, *keycodes):
+        self.pressed.difference_update(keycodes)
+
+    def release_all(self):
+        self.pressed.clear()
+
+    def send(self, *keycodes):
+        print("keyboard:", " + ".join(Keycode.names.get(k, str(k)) for k in keycodes))
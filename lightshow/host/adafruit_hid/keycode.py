@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_hid.keycode (USB HID usage IDs).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class Keycode():
+    names = {}          # keycode → name
+
+
+for _i, _c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+    setattr(Keycode, _c, 0x04 + _i)
+for _i, _c in enumerate(["ONE", "TWO", "THREE", "FOUR", "FIVE", "SIX", "SEVEN", "EIGHT", "NINE", "ZERO"]):
+    setattr(Keycode, _c, 0x1E + _i)
+for _name, _code in [("ENTER", 0x28), ("ESCAPE", 0x29), ("BACKSPACE", 0x2A), ("TAB", 0x2B), ("SPACE", 0x2C),
+                     ("RIGHT_ARROW", 0x4F), ("LEFT_ARROW", 0x50), ("DOWN_ARROW", 0x51), ("UP_ARROW", 0x52),
+                     ("CONTROL", 0xE0), ("SHIFT", 0xE1), ("ALT", 0xE2), ("GUI", 0xE3),
+                     ("RIGHT_CONTROL", 0xE4), ("RIGHT_SHIFT", 0xE5), ("RIGHT_ALT", 0xE6), ("RIGHT_GUI", 0xE7)]:
+    setattr(Keycode, _name, _code)
+for _name in dir(Keycode):
+    if _name.isupper():
+        Keycode.names[getattr(Keycode, _name)] = _name
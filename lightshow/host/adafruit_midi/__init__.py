@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the adafruit_midi library: prints the messages.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class MIDIMessage():
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join(
+            "{}={}".format(k, v) for k, v in sorted(vars(self).items())))
+
+
+class MIDI():
+
+    def __init__(self, midi_in=None, midi_out=None, in_channel=None, out_channel=0, debug=False, in_buf_size=30):
+        self.out_channel = out_channel
+
+    def send(self, msg, channel=None):
+        for m in (msg if isinstance(msg, (list, tuple)) else [msg]):
+            print("midi:", m)
+
+    def receive(self):
+        return None
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_midi.control_change.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from adafruit_midi import MIDIMessage
+
+
+class ControlChange(MIDIMessage):
+
+    def __init__(self, control, value, *, channel=None):
+        self.control = control
+        self.value = value
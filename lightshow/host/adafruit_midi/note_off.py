@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_midi.note_off.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from adafruit_midi import MIDIMessage
+
+
+class NoteOff(MIDIMessage):
+
+    def __init__(self, note, velocity=0, *, channel=None):
+        self.note = note
+        self.velocity = velocity
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_midi.note_on.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from adafruit_midi import MIDIMessage
+
+
+class NoteOn(MIDIMessage):
+
+    def __init__(self, note, velocity=127, *, channel=None):
+        self.note = note
+        self.velocity = velocity
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for adafruit_midi.pitch_bend.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from adafruit_midi import MIDIMessage
+
+
+class PitchBend(MIDIMessage):
+
+    def __init__(self, pitch_bend, *, channel=None):
+        self.pitch_bend = pitch_bend
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module board (Raspberry Pi Pico).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class Pin():
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return "board." + self.name
+
+
+for _i in range(29):
+    globals()["GP" + str(_i)] = Pin("GP" + str(_i))
+
+LED = GP25
+A0, A1, A2 = GP26, GP27, GP28
+SMPS_MODE = GP23
+VBUS_SENSE = GP24
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module digitalio: inputs follow
+# the pressed state of the input event queue (see hostinput.py), taking
+# the pull into account (pressed = low with Pull.UP).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import hostinput
+
+
+class Direction():
+    INPUT = "input"
+    OUTPUT = "output"
+
+
+class Pull():
+    UP = "up"
+    DOWN = "down"
+
+
+class DriveMode():
+    PUSH_PULL = "push_pull"
+    OPEN_DRAIN = "open_drain"
+
+
+class DigitalInOut():
+
+    def __init__(self, pin):
+        self.name = pin.name
+        self.inputs = hostinput.get()
+        self.inputs.register(self.name, self)
+        self.counter = hostinput.Counter("pin", self.name)
+        self.direction = Direction.INPUT
+        self.pull = None
+        self.pressed = False
+        self.last = None            # value at the previous read
+        self._value = False         # output value
+
+    def switch_to_output(self, value=False, drive_mode=DriveMode.PUSH_PULL):
+        self.direction = Direction.OUTPUT
+        self._value = value
+
+    def switch_to_input(self, pull=None):
+        self.direction = Direction.INPUT
+        self.pull = pull
+
+    def feed(self, pressed):
+        if pressed != self.pressed:
+            self.pressed = pressed
+            self.counter.events += 1
+
+    @property
+    def value(self):
+        if self.direction == Direction.OUTPUT:
+            return self._value
+        self.inputs.read()
+        value = self.pressed != (self.pull == Pull.UP)
+        if self.last is not None and value != self.last:
+            self.counter.seen += 1
+        self.last = value
+        return value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    def deinit(self):
+        pass
+
+    def report(self):
+        if self.direction == Direction.OUTPUT:
+            return []
+        return [repr(self.counter)]
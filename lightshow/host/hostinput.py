@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+#
+# Timestamped input events for the host stand-ins of the CircuitPython
+# modules (board, rotaryio, digitalio, adafruit_debouncer, ...).
+#
+# Events (time, input, value) are kept in a queue and delivered to the
+# inputs when a script reads them, such that a read sees exactly the
+# events that happened up to the current time. Inputs are named by
+# their pin, e.g., "GP4" (or "GP3") for
+# rotaryio.IncrementalEncoder(board.GP4, board.GP3). Every input counts the events delivered to it and the
+# changes the script actually saw; the difference are events lost
+# between two reads (several encoder steps folded into one change, a
+# press and release between two polls, ...).
+#
+# The clock is either simulated (advanced by time.sleep() and a fixed
+# cost per read, see hostrun.py) or real (events from the keyboard).
+#
+# Script format (one event per line, # starts a comment):
+#
+#   # time  input  action  arguments
+#   0.5     GP4    step    2          (2 steps at once, negative = back)
+#   1.0     GP4    spin    20 0.003   (20 steps, one every 3 ms)
+#   2.0     GP2    press   0.05       (press for 50 ms)
+#   3.0     GP12   level   1          (set the pressed state)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import heapq
+import threading
+import time
+
+_monotonic = time.monotonic
+_sleep = time.sleep
+
+
+class Stop(BaseException):
+    """Raised when the end time of a run is reached (a BaseException,
+    such that the script's own exception handlers do not catch it)."""
+
+
+class Clock():
+
+    def __init__(self, simulated=True):
+        self.simulated = simulated
+        self.start = _monotonic()
+        self.now = 0.0              # seconds since start (simulated)
+
+    def monotonic(self):
+        if self.simulated:
+            return self.now
+        return _monotonic() - self.start
+
+    def sleep(self, seconds):
+        if self.simulated:
+            self.now += max(seconds, 0)
+        else:
+            _sleep(seconds)
+
+    def advance(self, seconds):
+        if self.simulated:
+            self.now += seconds
+
+
+class Inputs():
+
+    def __init__(self, clock=None, cost=0.0, until=None):
+        self.clock = clock or Clock(False)
+        self.cost = cost            # simulated time per read of an input
+        self.until = until          # end of the run (None = forever)
+        self.queue = []             # heap of (time, sequence, input, value)
+        self.seq = 0
+        self.lock = threading.Lock()
+        self.devices = {}           # input name → device
+        self.reads = 0
+
+    def add(self, t, name, value):
+        with self.lock:
+            heapq.heappush(self.queue, (t, self.seq, name, value))
+            self.seq += 1
+
+    def register(self, name, device):
+        self.devices[name] = device
+
+    def check(self):
+        if self.until is not None and self.clock.monotonic() >= self.until:
+            raise Stop()
+
+    def read(self):
+        """Called by a device before it returns its state: advances the
+        clock by the cost of a read and delivers all due events."""
+        self.reads += 1
+        self.clock.advance(self.cost)
+        self.check()
+        self.deliver()
+
+    def deliver(self):
+        now = self.clock.monotonic()
+        with self.lock:
+            while self.queue and self.queue[0][0] <= now:
+                t, seq, name, value = heapq.heappop(self.queue)
+                device = self.devices.get(name)
+                if device is not None:
+                    device.feed(value)
+
+    def last(self):
+        """Time of the last pending event (or None)."""
+        return max(t for t, seq, name, value in self.queue) if self.queue else None
+
+    def load(self, lines):
+        """Adds the events of a script (see above)."""
+        for line in lines:
+            fields = line.split("#")[0].split()
+            if not fields:
+                continue
+            t, name, action, args = float(fields[0]), fields[1], fields[2], fields[3:]
+            if action == "step":
+                steps = int(args[0]) if args else 1
+                for i in range(abs(steps)):
+                    self.add(t, name, 1 if steps > 0 else -1)
+            elif action == "spin":
+                steps, interval = int(args[0]), float(args[1])
+                for i in range(abs(steps)):
+                    self.add(t + i * interval, name, 1 if steps > 0 else -1)
+            elif action == "press":
+                self.add(t, name, True)
+                self.add(t + (float(args[0]) if args else 0.05), name, False)
+            elif action == "level":
+                self.add(t, name, args[0] not in ("0", "False", "false"))
+            else:
+                raise ValueError("unknown action: " + line)
+
+    def report(self):
+        lines = ["time: {:.3f} s, reads: {}".format(self.clock.monotonic(), self.reads)]
+        devices = []
+        for device in self.devices.values():
+            if device not in devices:
+                devices.append(device)
+                lines.extend(device.report())
+        return "\n".join(lines)
+
+
+class Counter():
+    """Events delivered to an input and changes seen by its reader."""
+
+    def __init__(self, kind, name):
+        self.kind = kind
+        self.name = name
+        self.events = 0
+        self.seen = 0
+
+    def __repr__(self):
+        return "{} {}: {} events, {} seen, {} lost".format(
+            self.kind, self.name, self.events, self.seen, self.events - self.seen)
+
+
+inputs = None
+
+
+def get():
+    """Returns the inputs of the current run (real time and no events
+    if the stand-ins are used without hostrun.py)."""
+    global inputs
+    if inputs is None:
+        inputs = Inputs()
+    return inputs
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the neopixel library: a PixelBuffer whose show()
+# writes the pixels (scaled by brightness) with neopixel_write.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from neopixel_write import neopixel_write
+from pixelbuffer import PixelBuffer
+
+GRB = "GRB"
+RGB = "RGB"
+
+
+class NeoPixel(PixelBuffer):
+
+    def __init__(self, pin, n, bpp=3, brightness=1.0, auto_write=True, pixel_order=GRB):
+        super().__init__(n, pixel_order)
+        self.pin = pin
+        self.brightness = brightness
+        self.auto_write = auto_write
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        if self.auto_write:
+            self.show()
+
+    def fill(self, color):
+        super().fill(color)
+        if self.auto_write:
+            self.show()
+
+    def show(self):
+        if self.brightness >= 1.0:
+            neopixel_write(self.pin, self.buf)
+        else:
+            neopixel_write(self.pin, bytes(int(b * self.brightness) for b in self.buf))
+
+    def deinit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.deinit()
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module neopixel_write: counts the
+# frames and keeps the last one.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+frames = 0
+last = b""
+
+
+def neopixel_write(pin, buf):
+    global frames, last
+    frames += 1
+    last = bytes(buf)
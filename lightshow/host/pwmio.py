@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module pwmio (outputs are only
+# stored).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class PWMOut():
+
+    def __init__(self, pin, duty_cycle=0, frequency=500, variable_frequency=False):
+        self.pin = pin
+        self.duty_cycle = duty_cycle
+        self.frequency = frequency
+
+    def deinit(self):
+        pass
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module rotaryio: the position
+# follows the steps of the input event queue (see hostinput.py).
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import hostinput
+
+
+class IncrementalEncoder():
+
+    def __init__(self, pin_a, pin_b, divisor=4):
+        self.name = pin_a.name
+        self.inputs = hostinput.get()
+        self.inputs.register(self.name, self)
+        self.inputs.register(pin_b.name, self)  # steps may name either pin
+        self.counter = hostinput.Counter("encoder", self.name)
+        self._position = 0
+        self.last = 0               # position at the previous read
+
+    def feed(self, value):
+        self._position += value
+        self.counter.events += 1
+
+    @property
+    def position(self):
+        self.inputs.read()
+        if self._position != self.last:
+            self.counter.seen += 1
+            self.last = self._position
+        return self._position
+
+    @position.setter
+    def position(self, value):
+        self._position = self.last = value
+
+    def deinit(self):
+        pass
+
+    def report(self):
+        return [repr(self.counter)]
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module usb_hid.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+devices = []
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+#
+# Host stand-in for the CircuitPython module usb_midi.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class PortOut():
+
+    def write(self, buf, num=None):
+        return len(buf) if num is None else num
+
+
+ports = [None, PortOut()]
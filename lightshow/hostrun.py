@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Runs the CircuitPython scripts (neopixel.py, rotarytest.py, ...)
+# unchanged on the host.
+#
+# The directory host/ contains stand-ins for board, rotaryio, digitalio,
+# pwmio, neopixel, neopixel_write, usb_hid, usb_midi and the libraries
+# adafruit_debouncer, adafruit_fancyled, adafruit_hid and adafruit_midi
+# (HID reports and MIDI messages are printed). host/ comes first on the
+# module path, such that a script never imports a local file instead of
+# a stand-in (e.g., neopixel.py for import neopixel). The inputs are
+# driven by a timestamped event queue (see host/hostinput.py) that is fed from
+# a script of events (simulated clock: time.sleep() and every read of an
+# input advance the time) or from the keyboard (real time). At the end
+# the number of events every input lost between two reads is reported.
+#
+# Usage: ./hostrun.py -e spins.txt --until 10 neopixel.py
+#        ./hostrun.py -e spins.txt --sleep 0.01 -q ../hid/multi.py
+#        ./hostrun.py -k a=GP4:-1 -k d=GP4:+1 -k s=GP2:press neopixel.py
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - stand-ins take precedence over the script's directory, stand-ins for
+#   neopixel, adafruit_fancyled, HID and MIDI
+
+import os
+import sys
+import time
+import runpy
+import argparse
+import threading
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "host"))
+
+import hostinput
+
+
+def keyboard(inputs, keys, duration=0.05):
+    """Reads single keys from the terminal and adds their events (keys
+    maps a key to (input, value))."""
+    import tty
+    import termios
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+    try:
+        while True:
+            key = sys.stdin.read(1)
+            if key not in keys:
+                continue
+            name, value = keys[key]
+            now = inputs.clock.monotonic()
+            if value == "press":
+                inputs.add(now, name, True)
+                inputs.add(now + duration, name, False)
+            else:
+                for i in range(abs(value)):
+                    inputs.add(now, name, 1 if value > 0 else -1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def parse_key(arg):
+    """Parses KEY=INPUT:VALUE (VALUE is a number of steps or press)."""
+    key, target = arg.split("=", 1)
+    name, value = target.split(":")
+    return key, (name, value if value == "press" else int(value))
+
+
+def run(script, inputs, sleep=None, quiet=False):
+    """Runs script with the stand-ins and a patched time module."""
+    clock = inputs.clock
+    saved = time.monotonic, time.monotonic_ns, time.sleep
+
+    def _sleep(seconds):
+        inputs.check()
+        clock.sleep(seconds if sleep is None else sleep)
+        inputs.check()
+
+    time.monotonic = clock.monotonic
+    time.monotonic_ns = lambda: int(clock.monotonic() * 1e9)
+    time.sleep = _sleep
+    sys.path.insert(1, os.path.dirname(os.path.abspath(script)))     # after host/
+    out = open(os.devnull, "w") if quiet else sys.stdout
+    try:
+        with contextlib.redirect_stdout(out):
+            runpy.run_path(script, run_name="__main__")
+    except (hostinput.Stop, KeyboardInterrupt):
+        pass
+    finally:
+        time.monotonic, time.monotonic_ns, time.sleep = saved
+        if quiet:
+            out.close()
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Run a CircuitPython script on the host with simulated inputs.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('script', type=str, help='script to run')
+    parser.add_argument('-e', '--events', type=str, metavar="FILE", help='script of input events (simulated clock)')
+    parser.add_argument('-k', '--key', type=parse_key, metavar="KEY=INPUT:VALUE", help='map a key to encoder steps or a press (real time), e.g., a=GP4:-1 or s=GP2:press', action="append")
+    parser.add_argument('-u', '--until', type=float, metavar="S", help='end of the run in seconds (default: 1 s after the last event)')
+    parser.add_argument('--cost', type=float, metavar="S", help='simulated time per read of an input', default=0.00005)
+    parser.add_argument('--sleep', type=float, metavar="S", help='replace the duration of every time.sleep() of the script (polling interval)')
+    parser.add_argument('-q', '--quiet', action="store_true", help='suppress the output of the script')
+
+    args = parser.parse_args()
+
+    if args.key:
+        inputs = hostinput.Inputs(hostinput.Clock(False), until=args.until)
+        thread = threading.Thread(target=keyboard, args=(inputs, dict(args.key)), daemon=True)
+        thread.start()
+    else:
+        inputs = hostinput.Inputs(hostinput.Clock(True), args.cost, args.until)
+        if args.events:
+            with open(args.events) as f:
+                inputs.load(f)
+        if inputs.until is None:
+            inputs.until = (inputs.last() or 0) + 1
+    hostinput.inputs = inputs
+
+    run(args.script, inputs, args.sleep, args.quiet)
+    print(inputs.report())
@@ -0,0 +1,77 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Input-to-photon latency.
+#
+# Stamps input events (encoder, switch, key) and measures the time until
+# the first frame that reflects them is shown. A frame reflects an input
+# if it was rendered after the input; inputs that arrive between
+# rendering and showing count for the next frame. Several inputs before
+# one frame are measured from the first one. The last size latencies
+# are kept in a ring buffer (see ring.py), so the overhead is a clock
+# call per input and a comparison per frame.
+#
+# On the device the main loop polls the inputs: a change seen by a poll
+# happened after the previous poll, so it is stamped with the time of
+# the previous poll (worst case) and the latencies include the polling
+# interval. Times are integer nanoseconds (time.monotonic_ns), since
+# the floats of CircuitPython lose millisecond resolution after an hour.
+#
+# Usage: import as a module
+#
+#   lat = latency.Latency()
+#   lat.poll()          # before polling the inputs
+#   lat.input()         # input event (seen by this poll)
+#   lat.rendered()      # after rendering a frame
+#   lat.shown()         # after showing a frame
+#   print(lat)          # p50/p95/p99/max
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - inputs stamped at the previous poll, integer nanoseconds
+
+import time
+import ring
+
+
+class Latency():
+
+    def __init__(self, size=256, clock=time.monotonic_ns):
+        self.clock = clock              # returns ns
+        self.times = ring.Ring(size)    # latencies in ns
+        self.pending = None             # first input not yet rendered
+        self.ready = None               # first input rendered but not shown
+        self.polled = None              # time of the current poll
+        self.previous = None            # time of the previous poll
+
+    def poll(self):
+        """Marks a poll of the inputs."""
+        self.previous = self.polled
+        self.polled = self.clock()
+
+    def input(self, t=None):
+        """Stamps an input event at time t (default: the previous poll,
+        the earliest time the input can have happened, or now if the
+        inputs are not polled)."""
+        if self.pending is None:
+            if t is None:
+                t = self.previous if self.previous is not None else self.clock()
+            self.pending = t
+
+    def rendered(self):
+        if self.pending is not None and self.ready is None:
+            self.ready = self.pending
+            self.pending = None
+
+    def shown(self):
+        if self.ready is not None:
+            self.times.add(self.clock() - self.ready)
+            self.ready = None
+
+    def __repr__(self):
+        return "latency (ms): inputs {}, p50 {:.1f}, p95 {:.1f}, p99 {:.1f}, max {:.1f}".format(
+            self.times.total, *[t / 1e6 for t in self.times.percentiles((50, 95, 99, 100))])
@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Layouts for 2D LED matrices.
+#
+# A layout maps (x, y) to the index of the LED on the strip. The map is
+# computed once for the wiring of the panel (row by row or column by
+# column, serpentine/zigzag or progressive) and for tiled panels, such
+# that effects can address pixels in 2D without any mapping arithmetic:
+#
+#   for y, row in enumerate(layout.rows):
+#       for x, i in enumerate(row):
+#           pixels[i] = ...
+#
+# 1D effects can run along rows, columns or the serpentine path through
+# the matrix with along().
+#
+# Usage: import as a module
+#
+#   layout = matrix.grid(16, 16)                 # one serpentine panel
+#   layout = matrix.tiled(8, 8, 2, 2)            # 2x2 panels with 8x8 LEDs
+#   effect = matrix.along(layout, demos.ls_bar, "columns", shift=2)
+#   effect(k, layout.n, pixels, demos.col_rand)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+from demos import Frame, OFF
+
+
+class Layout():
+
+    def __init__(self, rows):
+        self.rows = rows                    # rows[y][x] = index on the strip
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.n = self.width * self.height
+        self.columns = [[row[x] for row in rows] for x in range(self.width)]
+        # the serpentine path: left to right, then right to left, ...
+        self.path = [i for y, row in enumerate(rows) for i in (row if y % 2 == 0 else reversed(row))]
+        # position of every LED (inverse map)
+        self.xy = [None] * self.n
+        for y, row in enumerate(rows):
+            for x, i in enumerate(row):
+                self.xy[i] = (x, y)
+
+    def lines(self, direction):
+        """Returns the rows, columns or the path (as a single line)."""
+        if direction == "rows":
+            return self.rows
+        if direction == "columns":
+            return self.columns
+        if direction == "path":
+            return [self.path]
+        raise ValueError("unknown direction: " + direction)
+
+    def __repr__(self):
+        return "\n".join(" ".join("{:4}".format(i) for i in row) for row in self.rows)
+
+
+def _panel(width, height, serpentine=True, vertical=False):
+    """rows[y][x] of one panel that is wired starting at the top left,
+    row by row (column by column if vertical)."""
+    rows = [[0] * width for y in range(height)]
+    if vertical:
+        for x in range(width):
+            for y in range(height):
+                yy = height - 1 - y if serpentine and x % 2 else y
+                rows[yy][x] = x * height + y
+    else:
+        for y in range(height):
+            for x in range(width):
+                xx = width - 1 - x if serpentine and y % 2 else x
+                rows[y][xx] = y * width + x
+    return rows
+
+
+def grid(width, height, serpentine=True, vertical=False):
+    """Returns the layout of one panel."""
+    return Layout(_panel(width, height, serpentine, vertical))
+
+
+def tiled(width, height, columns, rows, serpentine=True, vertical=False, snake=False):
+    """Returns the layout of columns x rows panels with width x height
+    LEDs each that are chained left to right, top to bottom (in a snake
+    if snake is set, i.e., every other row of panels right to left)."""
+    panel = _panel(width, height, serpentine, vertical)
+    size = width * height
+    out = [[0] * (width * columns) for y in range(height * rows)]
+    for r in range(rows):
+        for c in range(columns):
+            cc = columns - 1 - c if snake and r % 2 else c
+            base = (r * columns + c) * size
+            for y in range(height):
+                line = out[r * height + y]
+                for x in range(width):
+                    line[cc * width + x] = base + panel[y][x]
+    return Layout(out)
+
+
+def along(layout, effect, direction="rows", shift=0):
+    """Returns an effect (k, n, pixels, getcolor) that runs the 1D effect
+    on every row, column or along the serpentine path; line j runs at
+    k + j * shift. n is ignored (the layout defines the size)."""
+    lines = layout.lines(direction)
+    scratch = [OFF] * len(lines[0])
+
+    def render(k, n, pixels, getcolor):
+        for j, line in enumerate(lines):
+            if j == 0 or shift:
+                effect(k + j * shift, len(line), scratch, getcolor)
+            for i, col in zip(line, scratch):
+                pixels[i] = col
+    try:
+        render.__name__ = "{}_{}".format(getattr(effect, "__name__", "effect"), direction)
+    except AttributeError:          # read-only on CircuitPython
+        pass
+    return render
+
+
+def fx_diagonal(f, layout, pixels):
+    """Diagonal stripes moving with k (a 2D example)."""
+    col, k = f.color, f.k
+    for y, row in enumerate(layout.rows):
+        for x, i in enumerate(row):
+            pixels[i] = col if (x + y + k) % 4 == 0 else OFF
+
+
+def diagonal(layout):
+    """fx_diagonal for layout with the classic arguments."""
+    def ls_diagonal(k, n, pixels, getcolor):
+        fx_diagonal(Frame(k, getcolor), layout, pixels)
+    return ls_diagonal
+
+
+# 2D effects: name → function that returns the effect for a layout
+effects = {
+    "ls_diagonal": diagonal,
+}
@@ -4,7 +4,9 @@
 #
 # Demo of NeoPixel strip on Raspberry Pi Pico
 #
-# Preparation: copy neopixel.mpy from bundle (https://circuitpython.org/libraries) to /media/rja/CIRCUITPY/lib/
+# Preparation: copy adafruit_debouncer.mpy and neopixel.mpy from bundle (https://circuitpython.org/libraries) to /media/rja/CIRCUITPY/lib/
+#              and demos.py, registry.py, rainbow.py, palette.py, pixelbuffer.py, gamma.py,
+#              scheduler.py, transition.py, ring.py, latency.py to /media/rja/CIRCUITPY/
 #
 # Usage: Copy neopixel.py to /media/rja/CIRCUITPY/code.py
 #
@@ -35,6 +37,22 @@
 # Author: rja
 #
 # Changes:
+# 2026-10-18 (rja)
+# - added optional frame cache for periodic effects
+# - fixed frame rate with scheduler.py (drops frames instead of slowing
+#   down), switch 1 prints frame statistics
+# - brightness and gamma correction with a lookup table (gamma.py)
+#   instead of NeoPixel.brightness, applied to the color of each frame
+#   and the palettes; switch 2 adds a brightness mode for rotary
+#   encoder 1
+# - table-driven rainbow and fire palette (palette.py)
+# - crossfade when the effect changes (transition.py), switch 1 also
+#   prints the frame time
+# - input-to-photon latency (latency.py), printed by switch 1
+# - optional per-effect profiling of render, show and sleep time
+#   (profiling.py), printed by switch 1
+# - effects from the registry (registry.py), rainbow.py is only
+#   imported when one of its effects is selected
 # 2024-01-13 (rja)
 # - connected switches and 2nd rotary encoder
 # 2024-01-03 (rja)
@@ -49,18 +67,35 @@
 # Tasks:
 # - consider using interrupt-based handling of rotary encoder, for example,
 #   https://pypi.org/project/micropython-rotary-encoder/
-import time
+import sys
 import board
 import neopixel
 import rotaryio
 import digitalio
 import demos
+import registry
+import gamma
+import scheduler
+import transition
+import latency
+import pixelbuffer
+from neopixel_write import neopixel_write
 from adafruit_debouncer import Debouncer
 
 # Update this to match the number of NeoPixel LEDs connected to your board.
 num_pixels = 8
 gpio_neopixel = board.GP0
 
+# play periodic effects from a frame cache (requires cache.py on the board)
+cache_size = 0                      # memory limit in bytes, 0 = no cache
+if cache_size > 0:
+    import cache
+    frames = cache.FrameCache(cache_size)
+
+# measure render, show and sleep time per effect (requires profiling.py
+# on the board)
+profile = False
+
 # configure wiring
 
 # rotary encoder with switch and RGB LED
@@ -87,68 +122,130 @@ pin2.direction = digitalio.Direction.INPUT
 pin2.pull = digitalio.Pull.UP
 switch2 = Debouncer(pin2)
 
-# FIXME: move to demos.py
-effects = [
-    demos.ls_position,
-    demos.ls_unary,
-    demos.ls_binary,
-    demos.ls_gray,
-    demos.ls_pulse,
-    demos.ls_band,
-    demos.ls_bar,
-    demos.ls_strip,
-    demos.ls_sine,
-    demos.ls_random,
-    demos.ls_rainbow
-]
-
-
-with neopixel.NeoPixel(gpio_neopixel, num_pixels, auto_write=False) as pixels:
-    pixels.brightness = 0.25
-
-    k = 0                           # running variable for effect
-    pos1_last = encoder1.position   # last position of rotary encoder 1
-    pos2_last = encoder2.position   # last position of rotary encoder 2
-    mode1 = 0                       # 0 = speed, 1 = step
-    cyclelen = 0.01                 # length of one cycle in seconds
-    waitcycles = 10                 # number of cycles per step
-    currcycles = waitcycles         # remaining cycles until next step
-    effect = effects[0]             # current effect
-
-    while True:
-        # handle rotary encoder1 (speed or stepping)
-        pos1 = encoder1.position
-        if pos1 != pos1_last:
-            delta = pos1 - pos1_last                    # get direction
-            if mode1 == 0:
-                waitcycles = max(waitcycles + delta, 1) # change speed
-            else:
-                k += delta                              # step through effect
-        pos1_last = pos1
-
-        # handle switch2
-        switch2.update()
-        if switch2.rose:
-            mode1 = (mode1 + 1) % 2                     # switch mode
-
-        # handle rotary encoder2 (effect)
-        pos2 = encoder2.position
-        if pos2 != pos2_last:
-            demos.col_next()                            # change color
-            effect = effects[pos2 % len(effects)]       # change effect
-            k = 0                                       # start effect at 0
-        pos2_last = pos2
-
-        # show effect
-        effect(k, num_pixels, pixels, demos.col_rand)
-        pixels.show()
-
-        if mode1 == 0 and currcycles <= 0:              # step automatically
+# effects from the registry (modules of effects that are never selected
+# are not imported)
+effects = registry.names()
+
+# brightness and gamma are applied to the colors the effects use (the
+# color of each frame and the palettes), such that the strip shows the
+# pixels unchanged and the effects write them in C (NeoPixel)
+pixels = neopixel.NeoPixel(gpio_neopixel, num_pixels, brightness=1.0, auto_write=False)
+lut = gamma.LUT(0.25)
+palette_builds = 0              # lut.builds applied to the palettes
+
+
+def getcolor():
+    """The color of the frame, corrected by the lookup table."""
+    return lut.color(demos.col_rand())
+
+
+# while a transition runs, the previous effect is rendered into old, the
+# current frame is copied into new and both are blended into mixed
+old = pixelbuffer.PixelBuffer(num_pixels, "GRB")
+new = pixelbuffer.PixelBuffer(num_pixels, "GRB")
+mixed = bytearray(3 * num_pixels)
+trans = transition.Transition(num_pixels, 32, "crossfade")
+
+k = 0                           # running variable for effect
+pos1_last = encoder1.position   # last position of rotary encoder 1
+pos2_last = encoder2.position   # last position of rotary encoder 2
+mode1 = 0                       # 0 = speed, 1 = step, 2 = brightness
+cyclelen = 0.01                 # length of one cycle in seconds
+waitcycles = 10                 # number of cycles per step
+currcycles = waitcycles         # remaining cycles until next step
+effect = registry.get(effects[0])   # current effect
+old_effect = effect             # previous effect (during a transition)
+k_old = 0                       # running variable for previous effect
+sched = scheduler.Scheduler(1 / cyclelen)
+lat = latency.Latency()         # time from input to shown frame
+prof = None                     # profiler (if profile is set)
+if profile:
+    import profiling
+    prof = profiling.Profiler(effects, budget=cyclelen)
+    t = prof.clock()
+
+while True:
+    ticks = sched.wait()                            # wait for next cycle
+    if prof:
+        prof.add(effect, "sleep", t)
+
+    # handle rotary encoder1 (speed or stepping)
+    lat.poll()                                      # inputs changed since the last poll
+    pos1 = encoder1.position
+    if pos1 != pos1_last:
+        lat.input()
+        delta = pos1 - pos1_last                    # get direction
+        if mode1 == 0:
+            waitcycles = max(waitcycles + delta, 1) # change speed
+        elif mode1 == 1:
+            k += delta                              # step through effect
+        else:
+            lut.set_brightness(lut.brightness + delta / 20) # change brightness
+    pos1_last = pos1
+
+    # handle switch1
+    switch1.update()
+    if switch1.rose:
+        print(sched)                                # frame statistics
+        print(lat)
+        if prof:
+            print(prof.report())
+
+    # handle switch2
+    switch2.update()
+    if switch2.rose:
+        mode1 = (mode1 + 1) % 3                     # switch mode
+
+    # handle rotary encoder2 (effect)
+    pos2 = encoder2.position
+    if pos2 != pos2_last:
+        lat.input()
+        demos.col_next()                            # change color
+        old_effect, k_old = effect, k               # fade out current effect
+        effect = registry.get(effects[pos2 % len(effects)]) # change effect
+        k = 0                                       # start effect at 0
+        trans.start()
+    pos2_last = pos2
+
+    # step automatically (by elapsed time, not by rendered frames)
+    if mode1 == 0:
+        currcycles -= ticks                         # count cycles until next step
+        while currcycles <= 0:
             k += 1
-            currcycles = waitcycles                     # reset cycle counter
-        if k > 255:                                     # reset k
-            k = 0
-
-        currcycles -= 1                                 # count cycles until next step
-
-        time.sleep(cyclelen)                            # wait for next cycle
+            k_old += 1
+            currcycles += waitcycles                # reset cycle counter
+    if k > 255:                                     # reset k
+        k = 0
+    if k_old > 255:
+        k_old = 0
+
+    # correct the palettes (once an effect imported them) after the
+    # lookup table changed
+    if lut.builds != palette_builds and "palette" in sys.modules:
+        sys.modules["palette"].correct(lut)
+        palette_builds = lut.builds
+        if cache_size > 0:
+            frames.clear()                          # frames with old colors
+
+    # show effect
+    if prof:
+        t = prof.clock()
+    if cache_size > 0:
+        frames.set(k, effect, num_pixels, pixels, getcolor)
+    else:
+        effect(k, num_pixels, pixels, getcolor)
+    blend = trans.active()
+    if blend:                                       # blend with previous effect
+        old_effect(k_old, num_pixels, old, getcolor)
+        new.pack(pixels[:])
+        trans.blend(old.buf, new.buf, mixed)
+    lat.rendered()
+    if prof:
+        t = prof.add(effect, "render", t)
+    if blend:
+        neopixel_write(pixels.pin, mixed)
+    else:
+        pixels.show()
+    lat.shown()
+    if prof:
+        t = prof.add(effect, "show", t)
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Color wheel, HSV and gradient palettes as lookup tables.
+#
+# Every palette is a list of 256 (r, g, b) tuples that is computed
+# once, such that effects cost one table lookup per pixel:
+# - WHEEL: the color wheel of rainbowio.colorwheel (red → green → blue)
+# - gradient(): colors interpolated between stops (e.g., FIRE)
+# - hsv(): HSV colors with integer arithmetic
+# Only the tables of the effects are built on import (the module is
+# imported on the device), other palettes are built on demand.
+# Works on CircuitPython and the host; batch.py has vectorized versions
+# for whole arrays of hues. correct() rebuilds the tables with brightness
+# and gamma (gamma.LUT) on the device.
+#
+# Usage: import as a module
+#
+#   pixels[i] = palette.WHEEL[hue & 255]
+#   sunset = palette.gradient([(0, (255, 64, 0)), (1, (64, 0, 128))])
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - correct() applies a gamma.LUT to the tables
+# - RAINBOW and OCEAN built on demand (rainbow(), ocean())
+
+SIZE = 256
+
+
+def colorwheel(pos):
+    """The color at pos (0..255) on the color wheel (same colors as
+    rainbowio.colorwheel)."""
+    if pos < 0 or pos > 255:
+        return (0, 0, 0)
+    if pos < 85:
+        return (255 - pos * 3, pos * 3, 0)
+    if pos < 170:
+        pos -= 85
+        return (0, 255 - pos * 3, pos * 3)
+    pos -= 170
+    return (pos * 3, 0, 255 - pos * 3)
+
+
+def hsv(h, s=255, v=255):
+    """Converts hue, saturation and value (0..255 each) to (r, g, b)
+    using integer arithmetic only."""
+    h &= 255
+    if s == 0:
+        return (v, v, v)
+    sector = h * 6 // 256                   # 0..5
+    frac = h * 6 - sector * 256             # 0..255 within the sector
+    p = v * (255 - s) // 255
+    q = v * (255 - s * frac // 255) // 255
+    t = v * (255 - s * (255 - frac) // 255) // 255
+    return ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))[sector]
+
+
+def gradient(stops, size=SIZE):
+    """Interpolates the colors between stops (position 0..1, (r, g, b))
+    into a table with size entries."""
+    stops = sorted(stops)
+    table = []
+    j = 0
+    for i in range(size):
+        x = i / (size - 1)
+        while j < len(stops) - 2 and x > stops[j + 1][0]:
+            j += 1
+        (x0, c0), (x1, c1) = stops[j], stops[min(j + 1, len(stops) - 1)]
+        w = min(max((x - x0) / (x1 - x0), 0.0), 1.0) if x1 > x0 else 0.0
+        table.append(tuple(int(a + (b - a) * w + 0.5) for a, b in zip(c0, c1)))
+    return table
+
+
+def rainbow():
+    """HSV hues with full saturation and value."""
+    return [hsv(i) for i in range(SIZE)]
+
+
+def ocean():
+    """Gradient from dark blue to turquoise."""
+    return gradient([(0, (0, 0, 32)), (0.5, (0, 96, 160)), (1, (0, 255, 192))])
+
+
+def correct(lut):
+    """Rebuilds WHEEL and FIRE in place (the effects hold references)
+    with the colors corrected by lut (a gamma.LUT)."""
+    WHEEL[:] = [lut.color(colorwheel(i)) for i in range(SIZE)]
+    FIRE[:] = [lut.color(col) for col in gradient(FIRE_STOPS)]
+
+
+FIRE_STOPS = [(0, (0, 0, 0)), (0.35, (160, 0, 0)), (0.7, (255, 128, 0)), (1, (255, 255, 96))]
+
+WHEEL = [colorwheel(i) for i in range(SIZE)]
+FIRE = gradient(FIRE_STOPS)
@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Compact pixel buffer with the interface of neopixel.NeoPixel.
+#
+# Stores n pixels as 3*n bytes in one bytearray (in GRB or RGB order,
+# like the real NeoPixel) instead of a list of tuples. Supports
+# pixels[i] = (r, g, b), slice assignment and packed 0xRRGGBB ints.
+#
+# Writing single pixels costs a Python call per pixel, so effects should
+# render into a plain list (which shares the color tuples) that is
+# packed into the buffer once per frame with pack(): one join of the
+# bytes of every color, which are cached per color.
+#
+# Usage: import as a module
+#
+#   pixels = pixelbuffer.PixelBuffer(8, "GRB")
+#   pixels[0] = (255, 0, 0)
+#
+#   frame = [demos.OFF] * 8
+#   demos.ls_bar(k, 8, frame, demos.col_const)
+#   pixels.pack(frame)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - pack() for frames rendered into a list, shorter path for pixels[i]
+# - pack() rejects frames of the wrong length
+
+
+class PixelBuffer():
+
+    max_colors = 1024       # colors kept in the cache of pack()
+
+    def __init__(self, size, byteorder="GRB"):
+        if sorted(byteorder) != ["B", "G", "R"]:
+            raise ValueError("invalid byteorder: " + byteorder)
+        self.n = size
+        self.byteorder = byteorder
+        # offsets of red, green and blue within one pixel
+        self.offsets = (byteorder.index("R"), byteorder.index("G"), byteorder.index("B"))
+        self.buf = bytearray(3 * size)
+        self.packed = {}            # color → its 3 bytes in byteorder
+
+    def __len__(self):
+        return self.n
+
+    def _index(self, i):
+        if i < 0:
+            i += self.n
+        if i < 0 or i >= self.n:
+            raise IndexError("pixel index out of range")
+        return i
+
+    def _set(self, i, value):
+        o = 3 * i
+        try:
+            self.buf[o:o + 3] = self.packed.get(value) or self._pack(value)
+        except TypeError:           # unhashable color, e.g., a list
+            self.buf[o:o + 3] = self._bytes(value)
+
+    def _bytes(self, value):
+        """Returns the bytes of a color (r, g, b) or 0xRRGGBB in
+        byteorder."""
+        if isinstance(value, int):
+            value = ((value >> 16) & 255, (value >> 8) & 255, value & 255)
+        out = bytearray(3)
+        r, g, b = self.offsets
+        out[r], out[g], out[b] = value[0], value[1], value[2]
+        return bytes(out)
+
+    def _pack(self, value):
+        if len(self.packed) >= self.max_colors:
+            self.packed.clear()
+        out = self.packed[value] = self._bytes(value)
+        return out
+
+    def _get(self, i):
+        o = 3 * i
+        r, g, b = self.offsets
+        return (self.buf[o + r], self.buf[o + g], self.buf[o + b])
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self.n))
+            if len(value) != len(indices):
+                raise ValueError("expected {} values, got {}".format(len(indices), len(value)))
+            for i, v in zip(indices, value):
+                self._set(i, v)
+        elif 0 <= index < self.n and type(value) is tuple:
+            o = 3 * index
+            self.buf[o:o + 3] = self.packed.get(value) or self._pack(value)
+        else:
+            self._set(self._index(index), value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(self.n))]
+        return self._get(self._index(index))
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self._get(i)
+
+    def pack(self, colors):
+        """Copies n colors (e.g., a list the effect rendered into) into
+        the buffer."""
+        if len(colors) != self.n:
+            raise ValueError("expected {} values, got {}".format(self.n, len(colors)))
+        get = self.packed.get
+        try:
+            self.buf[:] = b"".join([get(col) or self._pack(col) for col in colors])
+        except TypeError:           # unhashable colors
+            self.buf[:] = b"".join([self._bytes(col) for col in colors])
+
+    def fill(self, color):
+        """Sets all pixels to color."""
+        self._set(0, color)
+        self.buf[3:] = self.buf[0:3] * (self.n - 1)
+
+    def rgb(self):
+        """Returns the pixels as bytes in RGB order (without copying if
+        the buffer already is in RGB order)."""
+        if self.byteorder == "RGB":
+            return memoryview(self.buf)
+        out = bytearray(len(self.buf))
+        for c, o in enumerate(self.offsets):
+            out[c::3] = self.buf[o::3]
+        return out
+
+    def __repr__(self):
+        return str(list(self))
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Offline pre-rendering of long shows on several cores.
+#
+# Splits a range of frames of an effect from demos.py into chunks that
+# are rendered by a process pool. Every worker writes its frames
+# directly into the memory-mapped output file, so no frames are sent
+# between processes. Random effects are seeded per frame, such that the
+# output does not depend on the number of workers.
+#
+# Usage: ./prerender.py -s 1024 -n 100000 -j 8 -o bar.show ls_bar
+#
+# Output: show file (see showfile.py)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - effects and their metadata from the registry (registry.py)
+# - random effects seeded with "seed:k" (no collisions for negative k)
+
+import os
+import sys
+import mmap
+import time
+import random
+import argparse
+import multiprocessing
+import demos
+import batch
+import registry
+import showfile
+
+version = "0.0.1"
+
+# frames rendered by one call of batch.render (bounds memory per worker)
+block_size = 256
+
+
+def render_chunk(path, offset, name, n, color, start, stop, seed):
+    """Renders frames start..stop-1 of effect name into the file at path
+    (frame start at byte offset)."""
+    effect = registry.info(name)
+    func = effect.func
+
+    def getcolor():
+        return color
+
+    framesize = 3 * n
+    with open(path, "r+b") as f:
+        out = mmap.mmap(f.fileno(), 0)
+        try:
+            for first in range(start, stop, block_size):
+                last = min(first + block_size, stop)
+                pos = offset + (first - start) * framesize
+                if effect.pure:
+                    frames = batch.render(func, range(first, last), n, getcolor)
+                    out[pos:pos + (last - first) * framesize] = frames.tobytes()
+                else:
+                    # impure: seed every frame to not depend on the chunking
+                    for k in range(first, last):
+                        random.seed("{}:{}".format(seed, k))
+                        out[pos:pos + framesize] = batch.render(func, [k], n, getcolor).tobytes()
+                        pos += framesize
+        finally:
+            out.close()
+    return stop - start
+
+
+def _render_chunk(args):
+    return render_chunk(*args)
+
+
+def render(path, name, n, color, start, frames, seed=0, jobs=None, offset=0, chunk=None):
+    """Renders frames of effect name starting at k = start into path
+    (which must be at least offset + 3 * n * frames bytes long)."""
+    jobs = jobs or os.cpu_count()
+    if chunk is None:
+        chunk = max(block_size, frames // (4 * jobs) + 1)
+    tasks = []
+    for first in range(start, start + frames, chunk):
+        last = min(first + chunk, start + frames)
+        tasks.append((path, offset + (first - start) * 3 * n, name, n, color, first, last, seed))
+    if jobs == 1:
+        return sum(_render_chunk(t) for t in tasks)
+    with multiprocessing.Pool(jobs) as pool:
+        return sum(pool.imap_unordered(_render_chunk, tasks))
+
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Pre-render an effect into a file using several processes.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('function', type=str, help='effect to render')
+    parser.add_argument('-o', '--output', type=str, metavar="FILE", help='output file', required=True)
+    parser.add_argument('-c', '--color', choices=["col_const", "col_rand"], help='function for color', default="col_const")
+    parser.add_argument('-s', '--size', type=int, metavar="NUM", help='number of LEDs', default=8)
+    parser.add_argument('-n', '--frames', type=int, metavar="NUM", help='number of frames', default=1000)
+    parser.add_argument('-k', '--start', type=int, metavar="K", help='first value of k', default=0)
+    parser.add_argument('-j', '--jobs', type=int, metavar="NUM", help='number of processes (default: number of cores)')
+    parser.add_argument('--fps', type=float, metavar="FPS", help='frame rate of the show', default=60)
+    parser.add_argument('--seed', type=int, metavar="NUM", help='seed for random effects', default=0)
+    parser.add_argument('-v', '--version', action="version", version="%(prog)s " + version)
+
+    args = parser.parse_args()
+
+    if args.function not in registry.names():
+        sys.exit("unknown effect: " + args.function)
+
+    offset = showfile.create(args.output, args.size, args.frames, "RGB", args.fps)
+
+    start = time.perf_counter()
+    frames = render(args.output, args.function, args.size, getattr(demos, args.color)(),
+                    args.start, args.frames, args.seed, args.jobs, offset)
+    elapsed = time.perf_counter() - start
+    print("{}: {} frames, {} pixels in {:.3f} s = {:.1f} frames/s".format(
+        args.function, frames, args.size, elapsed, frames / elapsed))
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Per-effect profiling of the main loop.
+#
+# Records for every effect the time spent rendering, showing and
+# sleeping (waiting for the next frame) in fixed-size ring buffers (see
+# ring.py). The rings are keyed by effect name and allocated for all
+# names of the registry when the profiler is created (names do not
+# import the modules of lazy effects), so profiling does not allocate
+# buffers while running (only effects that are not registered get their
+# rings when they are seen for the first time). Each measurement is one
+# clock call: add() returns the current time, which is the start of the
+# next phase. Times are integer nanoseconds (time.monotonic_ns), since
+# the floats of CircuitPython lose millisecond resolution after an hour.
+#
+# Usage: import as a module
+#
+#   prof = profiling.Profiler(registry.names(), budget=0.01)
+#   t = prof.clock()
+#   effect(k, n, pixels, getcolor)
+#   t = prof.add(effect, "render", t)
+#   pixels.show()
+#   t = prof.add(effect, "show", t)
+#   print(prof.report())
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - rings keyed by effect name, integer nanoseconds
+
+import time
+import ring
+
+phases = ("render", "show", "sleep")
+
+
+def name(effect):
+    """Returns the name of an effect (function or callable object)."""
+    return getattr(effect, "__name__", type(effect).__name__)
+
+
+class Profiler():
+
+    def __init__(self, effects=(), size=128, budget=None, clock=time.monotonic_ns):
+        self.size = size            # measurements kept per effect and phase
+        self.budget = budget        # frame period in seconds (optional)
+        self.clock = clock          # returns ns
+        self.rings = {}             # effect name → {phase: Ring}
+        for effect in effects:
+            self._rings(effect if isinstance(effect, str) else name(effect))
+
+    def _rings(self, key):
+        rings = self.rings.get(key)
+        if rings is None:
+            rings = self.rings[key] = {phase: ring.Ring(self.size) for phase in phases}
+        return rings
+
+    def add(self, effect, phase, start):
+        """Records the time since start for phase of effect (function or
+        name) and returns the current time."""
+        now = self.clock()
+        self._rings(effect if isinstance(effect, str) else name(effect))[phase].add(now - start)
+        return now
+
+    def summary(self, effect):
+        """Returns a one line summary (mean times in ms) for effect."""
+        key = effect if isinstance(effect, str) else name(effect)
+        rings = self.rings.get(key)
+        if rings is None:
+            return key
+        return "{} {}".format(key, " ".join(
+            "{} {:.2f}".format(phase, rings[phase].mean() / 1e6) for phase in phases))
+
+    def report(self):
+        """Returns a table with frames, mean, p95 and max per effect and
+        phase (in ms) and how often render + show exceeded the budget."""
+        lines = ["{:14} {:6} {:>6} {:>8} {:>8} {:>8}".format("effect", "phase", "frames", "mean", "p95", "max")]
+        for key, rings in self.rings.items():
+            if not rings["render"].total:
+                continue
+            for phase in phases:
+                r = rings[phase]
+                p95, pmax = r.percentiles((95, 100))
+                lines.append("{:14} {:6} {:6} {:8.3f} {:8.3f} {:8.3f}".format(
+                    key, phase, r.total, r.mean() / 1e6, p95 / 1e6, pmax / 1e6))
+            if self.budget:
+                render, show = rings["render"], rings["show"]
+                count = min(render.count, show.count)
+                budget = self.budget * 1e9
+                over = sum(1 for i in range(count) if render.values[i] + show.values[i] > budget)
+                lines.append("{:14} over budget ({:.1f} ms): {} of {} frames".format(
+                    "", 1000 * self.budget, over, count))
+        return "\n".join(lines)
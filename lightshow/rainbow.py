@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Palette effects for lightshow (see demos.py for the arguments).
+#
+# A separate module because the palettes (palette.py) are computed on
+# import: registry.py imports it when one of its effects is selected for
+# the first time.
+#
+# Usage: import as a module
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - moved ls_rainbow and ls_fire from demos.py
+# - ls_fire left out of the registry (no new effect on the device):
+#   the fire palette stays available as fx_fire and palette.FIRE
+
+from demos import Frame
+from palette import WHEEL, FIRE
+from registry import effect
+
+
+def _cycle(table, k, n, pixels):
+    """Spreads the 256 colors of table over the pixels, shifted by k."""
+    for i in range(n):
+        pixels[i] = table[(i * 256 // n + k) & 255]
+
+
+def fx_rainbow(f, n, pixels):
+    """A rainbow starting at k."""
+    _cycle(WHEEL, f.k, n, pixels)
+
+
+def fx_fire(f, n, pixels):
+    """The fire palette starting at k."""
+    _cycle(FIRE, f.k, n, pixels)
+
+
+# effects with the classic arguments (k, n, pixels, getcolor)
+
+
+@effect(period=lambda n: 256, batch=True)
+def ls_rainbow(k, n, pixels, getcolor):
+    fx_rainbow(Frame(k, getcolor), n, pixels)
@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Registry of the effects with metadata.
+#
+# Effects (ls_* functions) join the registry with the decorator
+# effect() and declare
+# - period: number of frames after which the effect repeats as a
+#   function of n (None: not periodic), used by cache.py
+# - pure: the frame depends only on k, n and the color (False for
+#   random effects), used by cache.py and prerender.py
+# - batch: batch.py has a vectorized kernel for the effect
+# - inplace: the effect writes every pixel, so it can render straight
+#   into a shared buffer without clearing it first (compositor.py)
+# Effects of modules that are not imported yet are listed in lazy; their
+# module is imported when the effect is selected for the first time, so
+# the device does not pay for effects that are never selected.
+#
+# Usage: import as a module
+#
+#   @registry.effect(period=lambda n: 2 * n)
+#   def ls_strip(k, n, pixels, getcolor):
+#       ...
+#
+#   for name in registry.names():
+#       func = registry.get(name)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+# (effect name, module) for effects that are imported on first use
+lazy = [
+    ("ls_rainbow", "rainbow"),
+]
+
+effects = {}        # name → Effect
+functions = {}      # function → Effect
+order = []          # names in the order of registration
+
+
+class Effect():
+
+    def __init__(self, func, period=None, pure=True, batch=False, inplace=True):
+        self.func = func
+        self.name = func.__name__
+        self.period = period
+        self.pure = pure
+        self.batch = batch
+        self.inplace = inplace
+
+    def __repr__(self):
+        return "Effect({}, period={}, pure={}, batch={}, inplace={})".format(
+            self.name, self.period is not None, self.pure, self.batch, self.inplace)
+
+
+def effect(period=None, pure=True, batch=False, inplace=True):
+    """Decorator that registers an effect with its metadata."""
+    def register(func):
+        add(Effect(func, period, pure, batch, inplace))
+        return func
+    return register
+
+
+def add(e):
+    if e.name not in effects:
+        order.append(e.name)
+    effects[e.name] = e
+    functions[e.func] = e
+
+
+def names():
+    """Returns the names of all effects (without importing lazy
+    modules)."""
+    return order + [name for name, module in lazy if name not in effects]
+
+
+def info(name):
+    """Returns the Effect for name (imports its module if necessary)."""
+    if name not in effects:
+        for lazyname, module in lazy:
+            if lazyname == name:
+                __import__(module)
+    if name not in effects:
+        raise KeyError("unknown effect: " + name)
+    return effects[name]
+
+
+def get(name):
+    """Returns the effect function for name."""
+    return info(name).func
+
+
+def lookup(func):
+    """Returns the Effect of a function (None for unregistered effects,
+    e.g., a Compositor)."""
+    return functions.get(func)
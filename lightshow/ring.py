@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Fixed-size ring buffer for measurements.
+#
+# The buffer is allocated once, adding a value never allocates (apart
+# from the value itself), so it can stay enabled on the device. It keeps
+# the last size values; percentiles are computed on demand.
+#
+# Usage: import as a module
+#
+#   times = ring.Ring(256)
+#   times.add(0.012)
+#   p50, p99 = times.percentiles((50, 99))
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+
+class Ring():
+
+    def __init__(self, size=256):
+        self.values = [0.0] * size
+        self.size = size
+        self.index = 0              # position of the next value
+        self.count = 0              # number of stored values (<= size)
+        self.total = 0              # number of values ever added
+
+    def add(self, value):
+        self.values[self.index] = value
+        self.index += 1
+        if self.index == self.size:
+            self.index = 0
+        if self.count < self.size:
+            self.count += 1
+        self.total += 1
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.index = self.count = 0
+
+    def mean(self):
+        return sum(self.values[:self.count]) / self.count if self.count else 0
+
+    def percentiles(self, ps=(50, 95, 99, 100)):
+        """Returns the ps-th percentiles (nearest rank) of the stored
+        values (0 if empty)."""
+        if not self.count:
+            return [0 for p in ps]
+        values = sorted(self.values[:self.count])
+        return [values[min(self.count - 1, int(self.count * p / 100))] for p in ps]
@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Fixed-timestep frame scheduler.
+#
+# Instead of sleeping a fixed time after each frame (such that the
+# frame period grows with render and show time), the scheduler sleeps
+# until the next deadline of a fixed frame rate. If rendering falls
+# behind, the missed frames are dropped: wait() returns the number of
+# elapsed frame periods, the caller advances its effect by that many
+# steps and renders only once.
+#
+# Times are integer nanoseconds (time.monotonic_ns): the floats of
+# CircuitPython have a 22 bit mantissa, so time.monotonic() loses
+# millisecond resolution after about an hour and deadlines computed
+# from it drift within hours, while installations run for days.
+#
+# Usage: import as a module
+#
+#   sched = scheduler.Scheduler(100)
+#   while True:
+#       ticks = sched.wait()
+#       ...
+#
+# or ./scheduler.py --fps 100 --cost 0.012 to simulate a main loop
+# against a simulated clock.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - frame time statistics (time between waking up and the next wait())
+# - integer nanoseconds instead of float seconds
+
+import time
+
+
+class SimulatedClock():
+    """A clock (in ns) that only advances when sleeping or by
+    advance()."""
+
+    def __init__(self, now=0):
+        self.now = now
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(int(seconds * 1e9), 0)
+
+    def advance(self, seconds):
+        self.now += int(seconds * 1e9)
+
+
+class Scheduler():
+
+    def __init__(self, fps, clock=time.monotonic_ns, sleep=time.sleep):
+        self.period = int(1e9 / fps + 0.5)  # target frame period in ns
+        self.clock = clock          # returns ns
+        self.sleep = sleep
+        self.deadline = None        # time of the next frame
+        self.start = None           # time of the first frame
+        self.now = None             # time of the current frame
+        self.frames = 0             # rendered frames
+        self.dropped = 0            # skipped frame periods
+        self.overruns = 0           # frames that missed their deadline
+        self.jitter_sum = 0         # sum of wake-up delays
+        self.jitter_max = 0         # largest wake-up delay
+        self.busy_sum = 0           # sum of frame times (work per frame)
+        self.busy_max = 0           # largest frame time
+
+    def wait(self):
+        """Sleeps until the next deadline and returns the number of frame
+        periods since the last call (more than 1 if frames were dropped)."""
+        now = self.clock()
+        if self.now is not None:
+            busy = now - self.now
+            self.busy_sum += busy
+            self.busy_max = max(self.busy_max, busy)
+        if self.deadline is None:
+            self.start = self.deadline = now
+        elif now < self.deadline:
+            self.sleep((self.deadline - now) / 1e9)
+            now = self.clock()
+        late = now - self.deadline
+        ticks = 1 + late // self.period
+        if ticks > 1:
+            self.overruns += 1
+            self.dropped += ticks - 1
+        else:
+            self.jitter_sum += late
+            self.jitter_max = max(self.jitter_max, late)
+        self.deadline += ticks * self.period
+        self.frames += 1
+        self.now = now
+        return ticks
+
+    def fps(self):
+        """Returns the achieved frame rate."""
+        if self.frames < 2 or self.now == self.start:
+            return 0
+        return (self.frames - 1) * 1e9 / (self.now - self.start)
+
+    def __repr__(self):
+        ontime = max(self.frames - self.overruns, 1)
+        return "frames: {}, fps: {:.1f}/{:.1f}, dropped: {}, overruns: {}, jitter: {:.2f}/{:.2f} ms, frame time: {:.2f}/{:.2f} ms".format(
+            self.frames, self.fps(), 1e9 / self.period, self.dropped, self.overruns,
+            self.jitter_sum / ontime / 1e6, self.jitter_max / 1e6,
+            self.busy_sum / max(self.frames - 1, 1) / 1e6, self.busy_max / 1e6)
+
+
+if __name__ == '__main__':
+    import argparse
+    import random
+
+    parser = argparse.ArgumentParser(description='Simulate a main loop with the frame scheduler.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('-f', '--fps', type=float, metavar="FPS", help='target frame rate', default=100)
+    parser.add_argument('-c', '--cost', type=float, metavar="S", help='mean render time per frame', default=0.008)
+    parser.add_argument('-j', '--jitter', type=float, metavar="S", help='random variation of render and sleep time', default=0.002)
+    parser.add_argument('-n', '--frames', type=int, metavar="NUM", help='number of frames', default=1000)
+
+    args = parser.parse_args()
+
+    sim = SimulatedClock()
+
+    def sleep(seconds):
+        sim.sleep(seconds + random.uniform(0, args.jitter))
+
+    sched = Scheduler(args.fps, sim.clock, sleep)
+    steps = 0
+    for i in range(args.frames):
+        steps += sched.wait()
+        sim.advance(max(0, random.gauss(args.cost, args.jitter)))
+    print(sched)
+    print("effect steps: {} in {:.3f} s (expected {:.0f})".format(steps, sim.now / 1e9, sim.now / 1e9 * args.fps))
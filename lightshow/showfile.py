@@ -0,0 +1,150 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Binary show files: recorded frames for playback.
+#
+# A show file consists of a header of 32 bytes
+#
+# | bytes | type    | content                          |
+# |-------+---------+----------------------------------|
+# |     4 | char[4] | magic "LSHW"                     |
+# |     2 | uint16  | version (1)                      |
+# |     2 | uint16  | header size (32)                 |
+# |     4 | uint32  | number of pixels n               |
+# |     4 | char[4] | color order ("RGB\0" or "GRB\0") |
+# |     4 | float32 | frame rate                       |
+# |     4 | uint32  | number of frames                 |
+# |     8 |         | reserved                         |
+#
+# (little endian) followed by the frames with 3*n bytes each. The player
+# memory-maps the file, so it starts instantly and seeks in O(1).
+#
+# Usage: import as a module
+#
+#   with showfile.ShowWriter("bar.show", 8, fps=20) as show:
+#       show.write(pixels)
+#
+#   show = showfile.Show("bar.show")
+#   show.load(42, pixels)
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+
+import mmap
+import struct
+
+MAGIC = b"LSHW"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI4sfI8x")
+
+
+def _header(n, byteorder, fps, frames):
+    return HEADER.pack(MAGIC, VERSION, HEADER.size, n, byteorder.encode(), fps, frames)
+
+
+def create(path, n, frames, byteorder="RGB", fps=60):
+    """Creates a show file with room for frames (all pixels off) and
+    returns the offset of the first frame."""
+    with open(path, "wb") as f:
+        f.write(_header(n, byteorder, fps, frames))
+        f.truncate(HEADER.size + 3 * n * frames)
+    return HEADER.size
+
+
+def _frame_bytes(pixels, byteorder):
+    """Returns the pixels as bytes in byteorder. pixels may be bytes, a
+    PixelBuffer, a NumPy array or a list of (r, g, b) tuples."""
+    if hasattr(pixels, "buf"):
+        if pixels.byteorder == byteorder:
+            return pixels.buf
+        pixels = pixels.rgb()
+    elif isinstance(pixels, list):
+        pixels = bytes(c for col in pixels for c in col)
+    if byteorder == "RGB":
+        return pixels
+    data = memoryview(pixels).cast("B")
+    out = bytearray(len(data))
+    for c, o in enumerate("RGB"):
+        out[byteorder.index(o)::3] = data[c::3]
+    return out
+
+
+class ShowWriter():
+
+    def __init__(self, path, n, byteorder="RGB", fps=60):
+        self.n = n
+        self.byteorder = byteorder
+        self.fps = fps
+        self.frames = 0
+        self.file = open(path, "wb")
+        self.file.write(_header(n, byteorder, fps, 0))
+
+    def write(self, pixels):
+        """Appends one frame (or several frames if pixels holds a
+        multiple of 3*n bytes, e.g., from batch.render)."""
+        data = memoryview(_frame_bytes(pixels, self.byteorder)).cast("B")
+        if len(data) % (3 * self.n) != 0:
+            raise ValueError("expected a multiple of {} bytes, got {}".format(3 * self.n, len(data)))
+        self.file.write(data)
+        self.frames += len(data) // (3 * self.n)
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.file.seek(0)
+        self.file.write(_header(self.n, self.byteorder, self.fps, self.frames))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class Show():
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size, n, byteorder, fps, frames = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a show file (version {}): {}".format(VERSION, path))
+        self.offset = size
+        self.n = n
+        self.byteorder = byteorder.rstrip(b"\0").decode()
+        self.fps = fps
+        self.frames = min(frames, (len(self.map) - size) // (3 * n)) if n else 0
+        self.view = memoryview(self.map)
+
+    def __len__(self):
+        return self.frames
+
+    def frame(self, i):
+        """Returns frame i as memoryview (no copy)."""
+        if i < 0:
+            i += self.frames
+        if i < 0 or i >= self.frames:
+            raise IndexError("frame index out of range")
+        start = self.offset + 3 * self.n * i
+        return self.view[start:start + 3 * self.n]
+
+    def load(self, i, pixels):
+        """Copies frame i into pixels (a PixelBuffer or any sequence of
+        pixels like neopixel.NeoPixel)."""
+        frame = self.frame(i)
+        if hasattr(pixels, "buf") and pixels.byteorder == self.byteorder:
+            pixels.buf[:] = frame
+            return
+        r, g, b = (self.byteorder.index(c) for c in "RGB")
+        for p in range(self.n):
+            o = 3 * p
+            pixels[p] = (frame[o + r], frame[o + g], frame[o + b])
+
+    def close(self):
+        self.view.release()
+        self.map.close()
@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+#
+# Transitions between two effects.
+#
+# While a transition runs, the outgoing and the incoming effect are both
+# rendered (into two pixel buffers) and blended into a third one for a
+# given number of frames:
+# - crossfade: both fade with integer weights (old*(256-w)>>8 +
+#   new*w>>8, the sum never exceeds 255) that start() precomputes for
+#   every frame of the transition; on the host start() also builds the
+#   two 256 byte tables per frame for translate; both are released when
+#   the transition ends, so blend() only looks them up
+# - wipe: the incoming effect moves in from pixel 0 (slice copies)
+# - dissolve: pixels switch to the incoming effect in a random order
+#   (a bit mask over the whole buffer)
+# On the host the buffers are combined with bytes.translate and
+# big-integer arithmetic (whole buffer per operation); CircuitPython
+# lacks translate and uses a loop for the crossfade.
+#
+# Usage: import as a module
+#
+#   trans = transition.Transition(n, 32, "crossfade")
+#   trans.start()
+#   while trans.active():
+#       old_effect(k_old, n, old, getcolor)
+#       new_effect(k, n, new, getcolor)
+#       trans.blend(old.buf, new.buf, out)
+#
+# or ./transition.py -s 1000 to measure the cost per frame.
+#
+# Author: rja
+#
+# Changes:
+# 2026-10-18 (rja)
+# - initial version
+# - crossfade weights and tables precomputed by start() and kept only
+#   while the transition runs
+
+from random import randint
+
+kinds = ["crossfade", "wipe", "dissolve"]
+
+
+class Transition():
+
+    def __init__(self, n, frames=32, kind="crossfade"):
+        if kind not in kinds:
+            raise ValueError("unknown transition: " + kind)
+        self.n = n
+        self.frames = frames        # length of the transition
+        self.kind = kind
+        self.step = frames          # current frame (= frames: inactive)
+        self.blended = 0            # number of blended frames
+        self.weights = None         # crossfade: (256 - w, w) per frame
+        self.tables = None          # crossfade: (old, new) tables per frame (host)
+        self.order = None           # dissolve: pixel order
+        self.mask = 0               # dissolve: 0xffffff for new pixels
+        if kind == "dissolve":
+            self.order = list(range(n))
+            for i in range(n - 1, 0, -1):           # Fisher-Yates
+                j = randint(0, i)
+                self.order[i], self.order[j] = self.order[j], self.order[i]
+
+    @staticmethod
+    def _tables(w):
+        return (bytes(v * (256 - w) >> 8 for v in range(256)),
+                bytes(v * w >> 8 for v in range(256)))
+
+    def start(self):
+        self.step = 0
+        self.mask = 0
+        if self.kind == "crossfade":
+            ws = [(i + 1) * 256 // (self.frames + 1) for i in range(self.frames)]
+            self.weights = [(256 - w, w) for w in ws]
+            if hasattr(bytearray, "translate"):     # not on CircuitPython
+                self.tables = [self._tables(w) for w in ws]
+
+    def active(self):
+        return self.step < self.frames
+
+    def blend(self, old, new, out):
+        """Blends the next frame of old and new (buffers with 3*n bytes)
+        into out; the incoming effect alone is shown after the last
+        frame."""
+        if self.step >= self.frames:
+            out[:] = new
+            return out
+        self.step += 1
+        self.blended += 1
+        if self.kind == "crossfade":
+            self._crossfade(old, new, out, self.step - 1)
+            if self.step == self.frames:            # release the tables
+                self.weights = self.tables = None
+        elif self.kind == "wipe":
+            m = 3 * (self.n * self.step // (self.frames + 1))
+            out[:m] = new[:m]
+            out[m:] = old[m:]
+        else:
+            self._dissolve(old, new, out)
+        return out
+
+    def _crossfade(self, old, new, out, step):
+        if self.tables is not None and hasattr(old, "translate") and hasattr(new, "translate"):
+            to, tn = self.tables[step]
+            a = int.from_bytes(old.translate(to), "little")
+            b = int.from_bytes(new.translate(tn), "little")
+            out[:] = (a + b).to_bytes(len(out), "little")
+        else:                       # no bytes.translate (CircuitPython)
+            v, w = self.weights[step]
+            for i in range(len(out)):
+                out[i] = (old[i] * v >> 8) + (new[i] * w >> 8)
+
+    def _dissolve(self, old, new, out):
+        first = self.n * (self.step - 1) // (self.frames + 1)
+        for i in self.order[first:self.n * self.step // (self.frames + 1)]:
+            self.mask |= 0xffffff << (24 * i)
+        a = int.from_bytes(old, "little")
+        b = int.from_bytes(new, "little")
+        out[:] = (a ^ ((a ^ b) & self.mask)).to_bytes(len(out), "little")
+
+    def __repr__(self):
+        return "transition: {} over {} frames, blended: {}".format(self.kind, self.frames, self.blended)
+
+
+if __name__ == '__main__':
+    import time
+    import argparse
+    import demos
+    import rainbow
+    import pixelbuffer
+
+    parser = argparse.ArgumentParser(description='Measure the cost of transitions between two effects.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('-s', '--size', type=int, metavar="NUM", help='number of LEDs', default=1000)
+    parser.add_argument('-f', '--frames', type=int, metavar="NUM", help='length of a transition', default=32)
+    parser.add_argument('-r', '--repeat', type=int, metavar="NUM", help='number of transitions', default=20)
+
+    args = parser.parse_args()
+
+    n = args.size
+    old = pixelbuffer.PixelBuffer(n)
+    new = pixelbuffer.PixelBuffer(n)
+    out = bytearray(3 * n)
+    rainbow.ls_rainbow(0, n, old, demos.col_const)
+    rainbow.fx_fire(demos.Frame(0, demos.col_const), n, new)
+    for kind in kinds:
+        trans = Transition(n, args.frames, kind)
+        start = time.perf_counter()
+        for r in range(args.repeat):
+            trans.start()
+            while trans.active():
+                trans.blend(old.buf, new.buf, out)
+        elapsed = time.perf_counter() - start
+        print("{:10} {:8.4f} ms/frame".format(kind, 1000 * elapsed / trans.blended))